@@ -19,6 +19,12 @@ logger = logging.getLogger(__name__)
 # Security scheme for JWT Bearer tokens
 security = HTTPBearer(auto_error=False)
 
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the app's shared outbound client (imported lazily: dependencies imports this module)"""
+    from dependencies import get_http_client
+    return get_http_client()
+
 class SessionManager:
     """Handles secure session management using signed cookies"""
     
@@ -88,40 +94,38 @@ class OAuthHandler:
             "redirect_uri": f"{settings.BASE_URL}/auth/callback",
         }
         
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                settings.GOOGLE_TOKEN_URL,
-                data=token_data,
-                headers={"Accept": "application/json"}
+        response = await _get_http_client().post(
+            settings.GOOGLE_TOKEN_URL,
+            data=token_data,
+            headers={"Accept": "application/json"}
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"Token exchange failed: {response.text}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Failed to exchange authorization code"
             )
-            
-            if response.status_code != 200:
-                logger.error(f"Token exchange failed: {response.text}")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Failed to exchange authorization code"
-                )
-            
-            return response.json()
+        
+        return response.json()
     
     async def get_user_info(self, access_token: str) -> Dict[str, Any]:
         """Get user information from Google using access token"""
         headers = {"Authorization": f"Bearer {access_token}"}
         
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                settings.GOOGLE_USERINFO_URL,
-                headers=headers
+        response = await _get_http_client().get(
+            settings.GOOGLE_USERINFO_URL,
+            headers=headers
+        )
+        
+        if response.status_code != 200:
+            logger.error(f"User info fetch failed: {response.text}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Failed to fetch user information"
             )
-            
-            if response.status_code != 200:
-                logger.error(f"User info fetch failed: {response.text}")
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail="Failed to fetch user information"
-                )
-            
-            return response.json()
+        
+        return response.json()
     
     def get_current_user(self, request: Request) -> Optional[Dict[str, Any]]:
         """Get current user from session cookie"""
@@ -36,6 +36,8 @@ class Settings:
         self.KEYS_DIR = Path("keys")
         self.PRIVATE_KEY_PATH = self.KEYS_DIR / "private_key.pem"
         self.PUBLIC_KEY_PATH = self.KEYS_DIR / "public_key.pem"
+        self._raw_public_key: str = ""
+        self._webpush = None
 
         # OAuth URLs
         self.GOOGLE_DISCOVERY_URL = "https://accounts.google.com/.well-known/openid_configuration"
@@ -111,29 +113,35 @@ class Settings:
             raise
 
     def get_webpush_instance(self):
-        """Get a configured WebPush instance"""
+        """Get a configured WebPush instance (created once, reused for every notification)"""
+        if self._webpush is not None:
+            return self._webpush
+
         try:
             from webpush import WebPush
             
             if not self.validate_vapid_config():
                 raise ValueError("VAPID keys not found")
             
-            return WebPush(
+            # Loading the VAPID key files is only worth doing once per process
+            self._webpush = WebPush(
                 public_key=self.PUBLIC_KEY_PATH,
                 private_key=self.PRIVATE_KEY_PATH,
                 subscriber=self.VAPID_SUBSCRIBER,
             )
+            return self._webpush
         except ImportError:
             raise ImportError("webpush library not installed. Run: uv add webpush")
 
     def get_raw_public_key(self) -> str:
-        """Get the raw public key for browser subscription"""
+        """Get the raw public key for browser subscription (cached after the first successful read)"""
+        if self._raw_public_key:
+            return self._raw_public_key
+
         try:
             from cryptography.hazmat.primitives import serialization
             
-            if not self.PUBLIC_KEY_PATH.exists():
-                raise FileNotFoundError("Public key file not found")
-            
+            # A missing key file surfaces as FileNotFoundError from open()
             with open(self.PUBLIC_KEY_PATH, 'rb') as f:
                 pem_data = f.read()
             
@@ -143,7 +151,8 @@ class Settings:
                 format=serialization.PublicFormat.UncompressedPoint
             )
             
-            return base64.urlsafe_b64encode(public_bytes).decode('utf-8').rstrip('=')
+            self._raw_public_key = base64.urlsafe_b64encode(public_bytes).decode('utf-8').rstrip('=')
+            return self._raw_public_key
             
         except Exception as e:
             print(f"❌ Failed to get raw public key: {e}")
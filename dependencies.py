@@ -8,6 +8,7 @@ redis_store = None
 permissions_manager = None
 logger = None
 jwt_manager = None
+http_client = None
 
 def get_redis_store():
     """Get the Redis store instance"""
@@ -27,6 +28,11 @@ def get_jwt_manager():
     return jwt_manager
 
 
+def get_http_client():
+    """Get the shared outbound HTTP client"""
+    return http_client
+
+
 def initialize_dependencies(redis_instance, permissions_instance, logger_instance, jwt_manager_instance=None):
     """Initialize global dependencies at startup"""
     global redis_store, permissions_manager, logger, jwt_manager
@@ -34,3 +40,9 @@ def initialize_dependencies(redis_instance, permissions_instance, logger_instanc
     permissions_manager = permissions_instance
     logger = logger_instance
     jwt_manager = jwt_manager_instance
+
+
+def initialize_http_client(client):
+    """Install the shared outbound HTTP client created at startup"""
+    global http_client
+    http_client = client
@@ -1,11 +1,11 @@
 import asyncio
 import base64
 import datetime
+import hashlib
 import json
 import logging
 import math
 import os
-import re
 import shutil
 import sys
 import tempfile
@@ -15,14 +15,14 @@ from pathlib import Path
 from typing import List, Optional
 
 import httpx
-from bs4 import BeautifulSoup
-from fastapi import FastAPI, HTTPException, Query, Response, Form, File, UploadFile, Depends, Path
-from fastapi.middleware.gzip import GZipMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse, RedirectResponse, FileResponse
+import orjson
+from fastapi import FastAPI, HTTPException, Query, Request, Response, Form, File, UploadFile, Depends, Path
+from fastapi.responses import HTMLResponse, JSONResponse, ORJSONResponse, RedirectResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from PIL import Image
 from PIL.ExifTags import TAGS
 from pydantic import BaseModel
+from starlette.background import BackgroundTask
 from starlette.middleware.base import BaseHTTPMiddleware
 
 # OAuth imports
@@ -49,13 +49,15 @@ from validation import (
 
 # Import extracted utilities
 from utils.logging_setup import setup_logging
-from utils.metadata_parser import inject_css_version, fetch_url, parse_meta_tags
+from utils.metadata_parser import inject_css_version, fetch_url, parse_meta_tags, create_http_client, single_flight
 from utils.background_tasks import perform_album_metadata_refresh, refresh_album_metadata
 from utils.export_utils import export_redis_database
 
 # Import middleware
-from middleware.app_middleware import CaseInsensitiveMiddleware, NoCacheMiddleware
+from middleware.app_middleware import CaseInsensitiveNoCacheMiddleware, NO_CACHE_HEADERS
+from middleware.compression_middleware import CompressionMiddleware
 from middleware.pretty_json_middleware import PrettyJSONMiddleware
+from middleware.upload_limit_middleware import UploadSizeLimitMiddleware
 
 # Import models
 from models.api_models import (
@@ -83,7 +85,31 @@ from auth import initialize_jwt_manager
 logger = setup_logging()
 
 # Initialize FastAPI app
-app = FastAPI(title="Climbing App", description="A climbing album and crew management system")
+app = FastAPI(
+    title="Climbing App",
+    description="A climbing album and crew management system",
+    default_response_class=ORJSONResponse
+)
+
+# Shared response header sets (NO_CACHE_HEADERS comes from middleware.app_middleware)
+_META_CACHE_HEADERS = {
+    "Cache-Control": "public, max-age=5,stale-while-revalidate=86400, immutable"
+}
+_IMMUTABLE_CACHE_HEADERS = {
+    "Cache-Control": "public, max-age=604800, immutable"
+}
+
+# HTML page routes and the file each serves through inject_css_version (versioned once at startup)
+_HTML_PAGES = {
+    "/": "static/crew.html",  # main crew page
+    "/albums": "static/albums.html",
+    "/memes": "static/memes.html",
+    "/locations": "static/locations.html",
+    "/knowledge": "static/index.html",
+    "/crew": "static/crew.html",
+    "/privacy": "static/privacy.html",
+    "/admin": "static/admin.html",  # user/permission management, stats and database operations
+}
 
 # Simple app initialization - no version tracking needed
 
@@ -172,6 +198,13 @@ async def startup_event():
     except Exception as e:
         logger.error(f"❌ Level cleanup failed: {e}")
 
+    # Pre-bake the versioned pages so the first visitor of each doesn't pay for the rewrite
+    for page in set(_HTML_PAGES.values()):
+        try:
+            inject_css_version(page)
+        except OSError as e:
+            logger.warning(f"Could not pre-render {page}: {e}")
+
 
 @app.on_event("startup")
 async def start_background_tasks():
@@ -180,6 +213,20 @@ async def start_background_tasks():
     asyncio.create_task(refresh_album_metadata(redis_store))
 
 
+@app.on_event("startup")
+async def start_http_client():
+    """Create the shared outbound HTTP client"""
+    dependencies.initialize_http_client(create_http_client())
+
+
+@app.on_event("shutdown")
+async def close_http_client():
+    """Close the shared outbound HTTP client"""
+    client = dependencies.get_http_client()
+    if client is not None:
+        await client.aclose()
+
+
 # === API Routes ===
 
 @app.get("/get-meta", tags=["utilities"])
@@ -205,23 +252,19 @@ async def get_meta(url: str = Query(..., description="URL to fetch metadata from
     cached_meta = await redis_store.get_cached_metadata(url)
     if cached_meta:
         logger.info(f"Returning cached metadata for: {url}")
-        headers = {
-            "Cache-Control": "public, max-age=5,stale-while-revalidate=86400, immutable"
-        }
-        return Response(content=json.dumps(cached_meta), media_type="application/json", headers=headers)
+        return Response(content=orjson.dumps(cached_meta), media_type="application/json", headers=_META_CACHE_HEADERS)
 
-    # Fetch new metadata
-    async with httpx.AsyncClient() as client:
-        response = await fetch_url(client, url)
+    async def fetch_meta():
+        response = await fetch_url(dependencies.get_http_client(), url)
         meta_data = parse_meta_tags(response.text, url)
-
         # Cache for 5 minutes
         await redis_store.cache_album_metadata(url, meta_data, ttl=300)
+        return meta_data
 
-        headers = {
-            "Cache-Control": "public, max-age=5,stale-while-revalidate=86400, immutable"
-        }
-        return Response(content=json.dumps(meta_data), media_type="application/json", headers=headers)
+    # Fetch new metadata, coalescing concurrent cold-cache requests for the same URL
+    meta_data = await single_flight(f"meta:{url}", fetch_meta)
+
+    return Response(content=orjson.dumps(meta_data), media_type="application/json", headers=_META_CACHE_HEADERS)
 
 
 # Albums endpoints moved to routes/albums.py
@@ -236,25 +279,36 @@ async def get_image(url: str = Query(..., description="URL of the image to fetch
         url: Direct URL to the image
         
     Returns:
-        - Image data with original content-type
+        - Image data with original content-type, streamed from upstream
         - Cache headers for 7 days
         
     Note:
         This endpoint helps avoid CORS issues and adds proper caching
     """
-    async with httpx.AsyncClient() as client:
-        response = await fetch_url(client, url)
-        content_type = response.headers.get("content-type", "application/octet-stream")
-        headers = {
-            "Cache-Control": "public, max-age=604800, immutable"
-        }
-        return Response(content=response.content, media_type=content_type, headers=headers)
+    # Full-size album covers can be several MB, so pipe them through instead of buffering
+    response = await fetch_url(dependencies.get_http_client(), url, stream=True)
+    return StreamingResponse(
+        response.aiter_bytes(),
+        media_type=response.headers.get("content-type", "application/octet-stream"),
+        headers=_IMMUTABLE_CACHE_HEADERS,
+        background=BackgroundTask(response.aclose)
+    )
 
 # === Redis Image Serving ===
 
 
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header matches etag (weak comparison, '*' matches anything)"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
 @app.get("/redis-image/{image_type}/{identifier:path}", tags=["utilities"])
 async def get_redis_image(
+    request: Request,
     image_type: str = Path(..., description="Type of image (climber, profile, meme)"),
     identifier: str = Path(..., description="Image identifier or path")
 ):
@@ -291,16 +345,18 @@ async def get_redis_image(
 
         # Different caching strategies based on image type
         if image_type == "climber" or image_type == "profile":
-            # For profile images that can be updated, use shorter cache with validation
+            # For profile images that can be updated, use shorter cache with validation.
+            # The ETag is a content digest so it matches across workers and restarts
+            etag = f'"{hashlib.blake2b(image_data, digest_size=16).hexdigest()}"'
             headers = {
                 "Cache-Control": "public, max-age=300, must-revalidate",
-                "ETag": f'"{hash(image_data)}"'
+                "ETag": etag
             }
+            if _etag_matches(request.headers.get("if-none-match", ""), etag):
+                return Response(status_code=304, headers=headers)
         else:
             # For other images (temp, memes, etc.), use longer cache
-            headers = {
-                "Cache-Control": "public, max-age=604800, immutable"
-            }
+            headers = _IMMUTABLE_CACHE_HEADERS
 
         return Response(
             content=image_data,
@@ -308,6 +364,8 @@ async def get_redis_image(
             headers=headers
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error serving Redis image {image_type}/{identifier}: {e}")
         raise HTTPException(status_code=500, detail="Failed to serve image")
@@ -315,100 +373,16 @@ async def get_redis_image(
 # === HTML Pages ===
 
 
-@app.get("/", response_class=HTMLResponse, include_in_schema=False)
-async def read_root():
-    """Serve the main crew page."""
-    content = inject_css_version("static/crew.html")
-    response = HTMLResponse(content=content, status_code=200)
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
-
-
-@app.get("/albums", response_class=HTMLResponse, include_in_schema=False)
-async def read_albums():
-    """Serve the climbing albums page."""
-    content = inject_css_version("static/albums.html")
-    response = HTMLResponse(content=content, status_code=200)
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
-
-
-@app.get("/memes", response_class=HTMLResponse, include_in_schema=False)
-async def read_memes():
-    """Serve the memes gallery page."""
-    content = inject_css_version("static/memes.html")
-    response = HTMLResponse(content=content, status_code=200)
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
-
-
-@app.get("/locations", response_class=HTMLResponse, include_in_schema=False)
-async def read_locations():
-    """Serve the locations page."""
-    content = inject_css_version("static/locations.html")
-    response = HTMLResponse(content=content, status_code=200)
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
-
-
-@app.get("/knowledge", response_class=HTMLResponse, include_in_schema=False)
-async def read_knowledge():
-    """Serve the knowledge base page."""
-    content = inject_css_version("static/index.html")
-    response = HTMLResponse(content=content, status_code=200)
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
-
-
-@app.get("/crew", response_class=HTMLResponse, include_in_schema=False)
-async def read_crew():
-    """Serve the crew management page."""
-    content = inject_css_version("static/crew.html")
-    response = HTMLResponse(content=content, status_code=200)
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
-
-
-@app.get("/privacy", response_class=HTMLResponse, include_in_schema=False)
-async def read_privacy():
-    """Serve the privacy policy page."""
-    content = inject_css_version("static/privacy.html")
-    response = HTMLResponse(content=content, status_code=200)
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
-
-
-@app.get("/admin", response_class=HTMLResponse, include_in_schema=False)
-async def read_admin():
-    """
-    Serve the admin panel page.
-    
-    This page provides administrative functions like:
-    - User management
-    - Permission control
-    - System statistics
-    - Database operations
-    """
-    content = inject_css_version("static/admin.html")
-    response = HTMLResponse(content=content, status_code=200)
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
+def _html_page_handler(page: str):
+    """Build a GET handler serving the versioned HTML of page"""
+    async def serve_page():
+        return HTMLResponse(content=inject_css_version(page), status_code=200, headers=NO_CACHE_HEADERS)
+    return serve_page
+
+
+for route, page in _HTML_PAGES.items():
+    app.add_api_route(route, _html_page_handler(page), methods=["GET"],
+                      response_class=HTMLResponse, include_in_schema=False)
 
 # === Health Check ===
 
@@ -509,24 +483,16 @@ async def favicon():
 @app.get("/sw.js")
 async def service_worker():
     """Serve service worker from root with proper headers"""
-    response = FileResponse("sw.js", media_type="application/javascript")
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
+    return FileResponse("sw.js", media_type="application/javascript", headers=NO_CACHE_HEADERS)
 
 
 @app.get("/static/manifest.json")
 async def manifest():
     """Serve manifest with no-cache headers to ensure theme color updates"""
-    response = FileResponse("static/manifest.json", media_type="application/json")
-    response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-    response.headers["Pragma"] = "no-cache"
-    response.headers["Expires"] = "0"
-    return response
-
-# Add GZip compression middleware (add first for best performance)
-app.add_middleware(GZipMiddleware, minimum_size=500)
+    return FileResponse("static/manifest.json", media_type="application/json", headers=NO_CACHE_HEADERS)
+
 app.add_middleware(PrettyJSONMiddleware, api_prefix="/api")
-app.add_middleware(CaseInsensitiveMiddleware)
-app.add_middleware(NoCacheMiddleware)
+app.add_middleware(CaseInsensitiveNoCacheMiddleware)
+app.add_middleware(UploadSizeLimitMiddleware)
+# Compression is added last so it is outermost and sees the final (pretty-printed) body
+app.add_middleware(CompressionMiddleware, minimum_size=500)
@@ -1,33 +1,53 @@
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.requests import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
+# Pages and asset types that must always be revalidated
+_NO_CACHE_PATHS = frozenset({"/", "/albums", "/memes", "/crew"})
+_NO_CACHE_SUFFIXES = (".css", ".js", ".html")
+NO_CACHE_HEADERS = {
+    "Cache-Control": "no-cache, no-store, must-revalidate, max-age=0",
+    "Pragma": "no-cache",
+    "Expires": "0",
+}
 
-class CaseInsensitiveMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        # Only make API routes case insensitive, not static file routes
-        if request.url.path.startswith("/api/"):
-            scope = dict(request.scope)  # Create a copy
-            scope["path"] = request.url.path.lower()
-            scope["raw_path"] = request.url.path.lower().encode()
-            request = Request(scope, request.receive)
 
-        response = await call_next(request)
-        return response
+class CaseInsensitiveNoCacheMiddleware:
+    """
+    Case-insensitive /api/ routing and no-cache headers for pages and static assets.
+
+    Implemented as a single pure ASGI middleware so each request pays for one
+    wrapper instead of two BaseHTTPMiddleware task groups.
+    """
 
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-class NoCacheMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        response = await call_next(request)
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
 
-        # Apply no-cache headers to static assets and HTML pages
-        path = request.url.path
+        path = scope["path"]
+
+        # Only make API routes case insensitive, not static file routes
+        if path.startswith("/api/"):
+            lower_path = path.lower()
+            # Most API paths are already lowercase; only rewrite when needed
+            if lower_path != path:
+                # The scope is per-request, so rewrite it in place rather than copying
+                scope["path"] = lower_path
+                scope["raw_path"] = lower_path.encode()
 
         # Cache-bust CSS, JS, and HTML files
-        if (path.endswith((".css", ".js", ".html")) or
-            path in ["/", "/albums", "/memes", "/crew"] or
+        if not (path.endswith(_NO_CACHE_SUFFIXES) or
+                path in _NO_CACHE_PATHS or
                 path.startswith("/static/")):
-            response.headers["Cache-Control"] = "no-cache, no-store, must-revalidate, max-age=0"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_no_cache(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).update(NO_CACHE_HEADERS)
+            await send(message)
 
-        return response 
+        await self.app(scope, receive, send_with_no_cache)
@@ -0,0 +1,163 @@
+import zlib
+
+import brotli
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Already-compressed payloads that only burn CPU when recompressed
+INCOMPRESSIBLE_CONTENT_TYPES = ("image/", "video/", "audio/", "application/zip", "application/gzip")
+# Streams that must reach the client chunk by chunk
+STREAMING_CONTENT_TYPES = ("text/event-stream",)
+
+
+def parse_accept_encoding(header: str) -> dict[str, float]:
+    """Map each Accept-Encoding coding to its q-value (missing or malformed q counts as 1)"""
+    codings: dict[str, float] = {}
+    for item in header.split(","):
+        coding, *params = (part.strip() for part in item.split(";"))
+        if not coding:
+            continue
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    pass  # ignore the malformed parameter and keep the default
+        codings[coding.lower()] = q
+    return codings
+
+
+def choose_encoding(header: str) -> str | None:
+    """Pick br or gzip if the client accepts it with q > 0, preferring br"""
+    codings = parse_accept_encoding(header)
+    wildcard = codings.get("*", 0.0)
+    for encoding in ("br", "gzip"):
+        if codings.get(encoding, wildcard) > 0:
+            return encoding
+    return None
+
+
+class _BrotliCompressor:
+    def __init__(self, quality: int) -> None:
+        self._compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        data = self._compressor.process(data)
+        return data + (self._compressor.finish() if final else self._compressor.flush())
+
+
+class _GZipCompressor:
+    def __init__(self, level: int) -> None:
+        # wbits=31 selects the gzip container
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def compress(self, data: bytes, *, final: bool) -> bytes:
+        data = self._compressor.compress(data)
+        return data + self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+class _CompressionResponder:
+    """Compress one response, buffering only its start message until the first body chunk"""
+
+    def __init__(self, app: ASGIApp, encoding: str, compressor, minimum_size: int) -> None:
+        self.app = app
+        self.encoding = encoding
+        self.compressor = compressor
+        self.minimum_size = minimum_size
+        self.send: Send = None  # type: ignore[assignment]
+        self.start_message: Message | None = None
+        self.passthrough = False
+        self.compressing = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_compressed)
+
+    async def send_compressed(self, message: Message) -> None:
+        if self.passthrough:
+            await self.send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            headers = Headers(raw=message["headers"])
+            content_type = headers.get("content-type", "")
+            # Leave already-encoded, incompressible and streaming responses alone
+            self.passthrough = "content-encoding" in headers or content_type.startswith(
+                INCOMPRESSIBLE_CONTENT_TYPES + STREAMING_CONTENT_TYPES)
+            if self.passthrough:
+                await self.send(message)
+            else:
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body":
+            # Unknown extension messages: flush the start and stop compressing
+            self.passthrough = True
+            if self.start_message is not None:
+                await self.send(self.start_message)
+                self.start_message = None
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressing:
+            await self.send({"type": "http.response.body",
+                             "body": self.compressor.compress(body, final=not more_body),
+                             "more_body": more_body})
+            return
+
+        start_message, self.start_message = self.start_message, None
+        headers = MutableHeaders(raw=start_message["headers"])
+
+        if not more_body and len(body) < self.minimum_size:
+            # Too small to be worth compressing
+            self.passthrough = True
+            await self.send(start_message)
+            await self.send(message)
+            return
+
+        self.compressing = True
+        compressed = self.compressor.compress(body, final=not more_body)
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(compressed))
+        await self.send(start_message)
+        await self.send({"type": "http.response.body", "body": compressed, "more_body": more_body})
+
+
+class CompressionMiddleware:
+    """
+    Brotli/gzip response compression for JSON and HTML.
+
+    Prefers brotli when the client accepts it, falls back to gzip, and skips
+    images and other already-compressed media (e.g. /get-image, /redis-image).
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 500, brotli_quality: int = 4, gzip_level: int = 6) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.brotli_quality = brotli_quality
+        self.gzip_level = gzip_level
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding == "br":
+            compressor = _BrotliCompressor(self.brotli_quality)
+        elif encoding == "gzip":
+            compressor = _GZipCompressor(self.gzip_level)
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        await _CompressionResponder(self.app, encoding, compressor, self.minimum_size)(scope, receive, send)
@@ -1,4 +1,4 @@
-import json
+import orjson
 import logging
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
@@ -48,12 +48,10 @@ class PrettyJSONMiddleware(BaseHTTPMiddleware):
 
             # Parse and re-format the JSON
             if body:
-                json_data = json.loads(body.decode('utf-8'))
-                pretty_json = json.dumps(
+                json_data = orjson.loads(body)
+                pretty_json = orjson.dumps(
                     json_data,
-                    indent=2,
-                    ensure_ascii=False,
-                    sort_keys=True  # Optional: sort keys for consistent output
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS  # Sorted keys for consistent output
                 )
 
                 # Create new response with pretty JSON
@@ -72,7 +70,7 @@ class PrettyJSONMiddleware(BaseHTTPMiddleware):
                 logger.debug(f"Pretty printed JSON response for {request.url.path}")
                 return new_response
 
-        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        except orjson.JSONDecodeError as e:
             # If JSON parsing fails, return original response
             logger.warning(f"Failed to pretty print JSON for {request.url.path}: {e}")
 
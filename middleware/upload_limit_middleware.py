@@ -0,0 +1,31 @@
+from starlette.datastructures import Headers
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from validation import MAX_IMAGE_SIZE
+
+# Room for the other form fields and multipart boundaries alongside the image
+MULTIPART_OVERHEAD = 1024 * 1024  # 1MB
+
+
+class UploadSizeLimitMiddleware:
+    """Reject oversized multipart uploads from their Content-Length before the body is parsed"""
+
+    def __init__(self, app: ASGIApp, max_body_size: int = MAX_IMAGE_SIZE + MULTIPART_OVERHEAD) -> None:
+        self.app = app
+        self.max_body_size = max_body_size
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            headers = Headers(scope=scope)
+            content_length = headers.get("content-length", "")
+            if (headers.get("content-type", "").startswith("multipart/form-data") and
+                    content_length.isdigit() and int(content_length) > self.max_body_size):
+                response = JSONResponse(
+                    {"detail": f"Upload too large (max {MAX_IMAGE_SIZE // (1024*1024)}MB image)"},
+                    status_code=413
+                )
+                await response(scope, receive, send)
+                return
+
+        await self.app(scope, receive, send)
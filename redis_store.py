@@ -1,16 +1,67 @@
+import asyncio
 import redis
 import json
+import orjson
 import uuid
 import hashlib
 import re
+import time
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional, Set, Any, Union
 import logging
 from pathlib import Path
-import re
 
 logger = logging.getLogger(__name__)
 
+# Precompiled validation patterns
+CLIMBER_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9\s\-_'.()]+$")
+EMAIL_PATTERN = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+GOOGLE_PHOTOS_URL_PATTERN = re.compile(r"^https://photos\.app\.goo\.gl/[a-zA-Z0-9]+$")
+
+# Bumped on every write that changes what the album listing shows (metadata, crew, new flags)
+ALBUMS_VERSION_KEY = "version:albums"
+# Bumped on climber writes that don't touch albums (profile edits, new or deleted climbers)
+CLIMBERS_VERSION_KEY = "version:climbers"
+# Bumped whenever a meme is added or deleted
+MEMES_VERSION_KEY = "version:memes"
+VERSION_KEYS = (ALBUMS_VERSION_KEY, CLIMBERS_VERSION_KEY, MEMES_VERSION_KEY)
+
+# Precompiled album date cleanup patterns (e.g. "Sat, Jun 7 📸" -> "Jun 7")
+DATE_EMOJI_SUFFIX_PATTERN = re.compile(r'📸.*$')
+# Dates are plain ASCII apart from the emoji, so skip Unicode-aware \s, \d and \b
+DATE_WEEKDAY_PREFIX_PATTERN = re.compile(r'^[A-Za-z]+,\s*', re.ASCII)
+DATE_YEAR_PATTERN = re.compile(r'\b20\d{2}\b', re.ASCII)
+
+# Exact month tokens, lowercased: abbreviations, full names and "sept" (so "Marathon" is not March)
+_MONTH_INDEX = {name.lower(): number for number, month in enumerate(
+    ("January", "February", "March", "April", "May", "June",
+     "July", "August", "September", "October", "November", "December"), start=1)
+    for name in (month, month[:3])}
+_MONTH_INDEX["sept"] = 9
+
+
+def _parse_album_date_fast(date_str: str) -> Optional[datetime]:
+    """Parse Google Photos album dates ("Sat, Jun 7, 2024 📸") by token lookup, or None if unrecognised"""
+    # Only the first date of a range matters, but a range's year comes after the dash
+    first, _, rest = date_str.replace(',', ' ').partition('–')
+    tokens = first.split()
+    month_pos = next((i for i, tok in enumerate(tokens) if tok.lower() in _MONTH_INDEX), None)
+    if month_pos is None:
+        return None
+
+    # Day usually follows the month ("Jun 7") but may precede it ("7 Jun")
+    neighbours = tokens[month_pos + 1:month_pos + 2] + tokens[max(month_pos - 1, 0):month_pos]
+    day = next((int(tok) for tok in neighbours if tok.isdigit() and len(tok) <= 2), None)
+    if day is None:
+        return None
+
+    year = next((int(tok) for tok in tokens + rest.split() if tok.isdigit() and len(tok) == 4),
+                datetime.now().year)
+    try:
+        return datetime(year, _MONTH_INDEX[tokens[month_pos].lower()], day)
+    except ValueError:
+        return None
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors"""
@@ -59,6 +110,8 @@ class RedisDataStore:
             self.binary_redis.ping()
             logger.info("Redis connections established successfully")
 
+            self._seed_version_counters()
+
         except Exception as e:
             logger.error(f"Failed to connect to Redis: {e}")
             raise
@@ -75,7 +128,7 @@ class RedisDataStore:
             raise ValidationError("Name must be between 1 and 100 characters")
 
         # Allow letters, numbers, spaces, and common punctuation
-        if not re.match(r"^[a-zA-Z0-9\s\-_'.()]+$", name):
+        if not CLIMBER_NAME_PATTERN.match(name):
             raise ValidationError("Name contains invalid characters")
 
         return name
@@ -85,8 +138,7 @@ class RedisDataStore:
         if not email or not isinstance(email, str):
             raise ValidationError("Email must be a non-empty string")
 
-        pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-        if not re.match(pattern, email):
+        if not EMAIL_PATTERN.match(email):
             raise ValidationError("Invalid email format")
 
         return email.lower()
@@ -97,13 +149,15 @@ class RedisDataStore:
             return []
 
         validated_skills = []
+        seen = set()
         for skill in skills:
             if not isinstance(skill, str):
                 raise ValidationError(f"Skill must be a string: {skill}")
             skill = skill.strip()
             if not skill:
                 raise ValidationError("Skill cannot be empty")
-            if skill not in validated_skills:  # Remove duplicates
+            if skill not in seen:  # Remove duplicates
+                seen.add(skill)
                 validated_skills.append(skill)
 
         return validated_skills
@@ -113,8 +167,7 @@ class RedisDataStore:
         if not url or not isinstance(url, str):
             raise ValidationError("URL must be a non-empty string")
 
-        pattern = r"^https://photos\.app\.goo\.gl/[a-zA-Z0-9]+$"
-        if not re.match(pattern, url):
+        if not GOOGLE_PHOTOS_URL_PATTERN.match(url):
             raise ValidationError("Invalid Google Photos URL format")
 
         return url
@@ -125,13 +178,15 @@ class RedisDataStore:
             return []
 
         validated_attributes: List[str] = []
+        seen = set()
         for attribute in attributes:
             if not isinstance(attribute, str):
                 raise ValidationError(f"Attribute must be a string: {attribute}")
             attribute = attribute.strip()
             if not attribute:
                 raise ValidationError("Attribute cannot be empty")
-            if attribute not in validated_attributes:  # Remove duplicates
+            if attribute not in seen:  # Remove duplicates
+                seen.add(attribute)
                 validated_attributes.append(attribute)
 
         return validated_attributes
@@ -161,7 +216,7 @@ class RedisDataStore:
         # Note: level values are calculated dynamically, not stored
         climber_data = {
             "name": name,
-            "location": json.dumps(location),
+            "location": orjson.dumps(location),
             "climbs": "0",
             "is_new": "true",
             "created_at": datetime.now().isoformat(),
@@ -189,6 +244,7 @@ class RedisDataStore:
         # Update indexes
         pipe.sadd("index:climbers:all", name)
         pipe.sadd("index:climbers:new", name)
+        pipe.incr(CLIMBERS_VERSION_KEY)
 
         # Index skills
         for skill in skills:
@@ -210,6 +266,13 @@ class RedisDataStore:
 
         logger.info(f"Added climber: {name}")
 
+    async def climbers_exist(self, names: List[str]) -> List[bool]:
+        """Check which climbers exist in one round trip, without loading them"""
+        pipe = self.redis.pipeline()
+        for name in names:
+            pipe.exists(f"climber:{name}")
+        return [bool(exists) for exists in pipe.execute()]
+
     async def get_climber(self, name: str) -> Optional[Dict]:
         """Get climber with proper data types"""
         climber_key = f"climber:{name}"
@@ -223,8 +286,21 @@ class RedisDataStore:
         tags = list(self.redis.smembers(f"climber:{name}:tags"))
         achievements = list(self.redis.smembers(f"climber:{name}:achievements"))
 
+        # Dynamically compute locations visited from albums index
+        try:
+            locations_visited = await self.get_locations_for_climber(name)
+        except Exception:
+            locations_visited = []
+
+        return self._build_climber(name, climber_data, skills, tags, achievements, locations_visited)
+
+    def _build_climber(
+        self, name: str, climber_data: Dict, skills: List[str], tags: List[str],
+        achievements: List[str], locations_visited: List[str]
+    ) -> Dict:
+        """Assemble the API climber dict from its raw hash, sets and visited locations"""
         # Parse remaining JSON fields
-        climber_data["location"] = json.loads(climber_data.get("location", "[]"))
+        climber_data["location"] = orjson.loads(climber_data.get("location", "[]"))
         climber_data["skills"] = skills
         climber_data["tags"] = tags
         climber_data["achievements"] = achievements
@@ -236,7 +312,6 @@ class RedisDataStore:
 
         # Calculate levels dynamically using current logic (ignore stored values)
         # Include locations visited in level calculation
-        locations_visited = await self.get_locations_for_climber(name)
         total_level, level_from_skills, level_from_climbs, level_from_achievements, level_from_locations = self.calculate_climber_level(
             len(skills), climbs, len(achievements), len(locations_visited))
         climber_data["level"] = total_level
@@ -248,12 +323,6 @@ class RedisDataStore:
         # Add computed fields
         climber_data["first_climb_date"] = climber_data.get("first_climb_date", None)
         climber_data["face"] = f"/redis-image/climber/{name}/face"
-
-        # Dynamically compute locations visited from albums index
-        try:
-            locations_visited = await self.get_locations_for_climber(name)
-        except Exception:
-            locations_visited = []
         climber_data["locations_visited"] = locations_visited
 
         return climber_data
@@ -278,6 +347,15 @@ class RedisDataStore:
 
         name_changed = name != original_name
         original_key = f"climber:{original_name}"
+        # Albums that list the climber under the old name, checked in one round trip so
+        # the crew moves can ride in the same transaction as the climber rename
+        album_urls = list(self.redis.smembers(f"index:albums:crew:{original_name}")) if name_changed else []
+        crew_urls = []
+        if album_urls:
+            check_pipe = self.redis.pipeline()
+            for url in album_urls:
+                check_pipe.sismember(f"album:{url}:crew", original_name)
+            crew_urls = [url for url, is_member in zip(album_urls, check_pipe.execute()) if is_member]
         new_key = f"climber:{name}"
 
         # Get current climbs
@@ -289,7 +367,7 @@ class RedisDataStore:
         # Update climber data (levels calculated dynamically, not stored)
         updated_data = {
             "name": name,
-            "location": json.dumps(location),
+            "location": orjson.dumps(location),
             "climbs": str(current_climbs),
             "is_new": "true" if current_climber.get("is_new", False) else "false",
             "created_at": current_climber.get("created_at", datetime.now().isoformat()),
@@ -300,23 +378,33 @@ class RedisDataStore:
             # Create new record
             pipe.hset(new_key, mapping=updated_data)
 
-            # Move sets only if they exist
-            if self.redis.exists(f"climber:{original_name}:skills"):
-                pipe.rename(f"climber:{original_name}:skills", f"climber:{name}:skills")
-            if self.redis.exists(f"climber:{original_name}:tags"):
-                pipe.rename(f"climber:{original_name}:tags", f"climber:{name}:tags")
-            if self.redis.exists(f"climber:{original_name}:achievements"):
-                pipe.rename(f"climber:{original_name}:achievements", f"climber:{name}:achievements")
+            # Drop the old sets; the new ones are rebuilt from the resolved values below
+            pipe.delete(f"climber:{original_name}:skills", f"climber:{original_name}:tags",
+                        f"climber:{original_name}:achievements")
 
             # Update indexes
             pipe.srem("index:climbers:all", original_name)
             pipe.sadd("index:climbers:all", name)
+            if current_climber.get("is_new", False):
+                pipe.srem("index:climbers:new", original_name)
+                pipe.sadd("index:climbers:new", name)
+            # Move the name in every album that lists it, with its reverse index
+            for url in crew_urls:
+                pipe.srem(f"album:{url}:crew", original_name)
+                pipe.sadd(f"album:{url}:crew", name)
+            if crew_urls:
+                pipe.srem(f"index:albums:crew:{original_name}", *crew_urls)
+                pipe.sadd(f"index:albums:crew:{name}", *crew_urls)
+            # Album listings only change if some album shows the old name
+            if crew_urls:
+                pipe.incr(ALBUMS_VERSION_KEY)
 
             # Delete old record
             pipe.delete(original_key)
         else:
             # Update existing record
             pipe.hset(original_key, mapping=updated_data)
+        pipe.incr(CLIMBERS_VERSION_KEY)
 
         # Clean up old indexes if name changed
         if name_changed:
@@ -363,52 +451,20 @@ class RedisDataStore:
         # Execute all operations
         pipe.execute()
 
-        # Handle album crew references and image renaming (after pipeline execution)
+        # Handle image renaming (after pipeline execution)
         if name_changed:
-            # Update album crew references
-            album_urls = list(self.redis.smembers(f"index:albums:crew:{original_name}"))
-            for url in album_urls:
-                try:
-                    # Remove old name from crew set and add new name
-                    album_crew_key = f"album:{url}:crew"
-                    crew_updated = False
-
-                    # Check if old name is in the crew set
-                    if self.redis.sismember(album_crew_key, original_name):
-                        # Use pipeline for atomic crew update
-                        crew_pipe = self.redis.pipeline()
-                        crew_pipe.srem(album_crew_key, original_name)
-                        crew_pipe.sadd(album_crew_key, name)
-                        crew_pipe.execute()
-                        crew_updated = True
-
-                        logger.debug(f"Updated crew in album {url}: {original_name} -> {name}")
-
-                    # Update reverse indexes
-                    if crew_updated:
-                        self.redis.srem(f"index:albums:crew:{original_name}", url)
-                        self.redis.sadd(f"index:albums:crew:{name}", url)
-
-                except Exception as e:
-                    logger.error(f"Failed to update album crew for {url}: {e}")
-
-            logger.info(f"Updated {len(album_urls)} album crew references for: {original_name} -> {name}")
+            logger.info(f"Updated {len(crew_urls)} album crew references for: {original_name} -> {name}")
 
             # Handle image renaming in binary database
             original_image_key = f"image:climber:{original_name}/face"
             new_image_key = f"image:climber:{name}/face"
             
             try:
-                # Check if original image exists and get its data
-                image_data = self.binary_redis.get(original_image_key)
-                if image_data:
-                    # Store with new key
-                    self.binary_redis.set(new_image_key, image_data)
-                    # Delete old key
-                    self.binary_redis.delete(original_image_key)
-                    logger.info(f"Moved image from {original_image_key} to {new_image_key}")
-                else:
-                    logger.debug(f"No image found at {original_image_key} to move")
+                # Move the image server-side so its bytes never leave Redis
+                self.binary_redis.rename(original_image_key, new_image_key)
+                logger.info(f"Moved image from {original_image_key} to {new_image_key}")
+            except redis.ResponseError:
+                logger.debug(f"No image found at {original_image_key} to move")
             except Exception as e:
                 logger.error(f"Failed to move image from {original_image_key} to {new_image_key}: {e}")
 
@@ -439,7 +495,8 @@ class RedisDataStore:
                 "description": metadata.get("description", ""),
                 "date": metadata.get("date", ""),
                 "image_url": metadata.get("imageUrl", ""),
-                "cover_image": metadata.get("cover_image", "")
+                "cover_image": metadata.get("cover_image", ""),
+                "metadata_refreshed_at": datetime.now().isoformat()
             })
 
         # Optional album location (free text)
@@ -458,6 +515,7 @@ class RedisDataStore:
 
         # Update indexes
         pipe.sadd("index:albums:all", url)
+        pipe.incr(ALBUMS_VERSION_KEY)
 
         # Index by crew members
         for crew_member in crew:
@@ -499,8 +557,12 @@ class RedisDataStore:
 
         return album_data
 
-    async def update_album_crew(self, url: str, new_crew: List[str]) -> None:
-        """Update album crew members using proper Redis data types"""
+    async def album_exists(self, url: str) -> bool:
+        """Check whether an album exists without loading it"""
+        return bool(self.redis.exists(f"album:{url}"))
+
+    async def update_album_crew(self, url: str, new_crew: List[str], current_album: Optional[Dict] = None) -> None:
+        """Update album crew members using proper Redis data types (pass current_album if already loaded)"""
         
         # Validate inputs
         url = self._validate_url(url)
@@ -508,8 +570,9 @@ class RedisDataStore:
         
         album_key = f"album:{url}"
         
-        # Get current album and crew
-        current_album = await self.get_album(url)
+        # Get current album and crew unless the caller already has it
+        if current_album is None:
+            current_album = await self.get_album(url)
         if not current_album:
             raise ValidationError(f"Album not found: {url}")
         
@@ -520,6 +583,7 @@ class RedisDataStore:
         
         # Update album timestamp
         pipe.hset(album_key, "updated_at", datetime.now().isoformat())
+        pipe.incr(ALBUMS_VERSION_KEY)
         
         # Clear and update crew set
         pipe.delete(f"album:{url}:crew")
@@ -591,8 +655,25 @@ class RedisDataStore:
 
         # Update album with new metadata
         self.redis.hset(album_key, mapping=metadata_update)
+        self.redis.incr(ALBUMS_VERSION_KEY)
         logger.info(f"Updated metadata for album: {url}")
 
+    async def mark_album_metadata_refreshed(self, url: str) -> bool:
+        """Record that the album's metadata was just fetched from Google Photos (False if it was deleted meanwhile)"""
+        album_key = f"album:{url}"
+        marked = False
+
+        # WATCH the hash so a concurrent delete can't be resurrected as a timestamp-only album
+        def mark(pipe) -> None:
+            nonlocal marked
+            marked = bool(pipe.exists(album_key))
+            if marked:
+                pipe.multi()
+                pipe.hset(album_key, "metadata_refreshed_at", datetime.now().isoformat())
+
+        self.redis.transaction(mark, album_key)
+        return marked
+
     async def delete_album(self, url: str) -> bool:
         """Delete an album using proper Redis data types"""
         
@@ -628,6 +709,7 @@ class RedisDataStore:
         # Delete album data and crew set
         pipe.delete(f"album:{url}")
         pipe.delete(f"album:{url}:crew")
+        pipe.incr(ALBUMS_VERSION_KEY)
         
         # Execute all operations
         pipe.execute()
@@ -660,7 +742,7 @@ class RedisDataStore:
             album = await self.get_album(url)
             if album:
                 new_crew = [member for member in album["crew"] if member != name]
-                await self.update_album_crew(url, new_crew)
+                await self.update_album_crew(url, new_crew, current_album=album)
         
         # Use pipeline for atomic operations
         pipe = self.redis.pipeline()
@@ -668,6 +750,7 @@ class RedisDataStore:
         # Remove from indexes
         pipe.srem("index:climbers:all", name)
         pipe.srem("index:climbers:new", name)
+        pipe.incr(CLIMBERS_VERSION_KEY)
         
         # Remove from skill indexes
         for skill in skills:
@@ -710,7 +793,6 @@ class RedisDataStore:
             
             # Process albums chronologically
             albums_with_dates = []
-            import re
             
             for album in albums:
                 try:
@@ -719,19 +801,25 @@ class RedisDataStore:
                     if not date_str:
                         continue
                     
+                    album_date = _parse_album_date_fast(date_str)
+                    if album_date:
+                        albums_with_dates.append((album_date, album))
+                        continue
+
+                    # Fall back to the regex/strptime path for unusual formats
                     try:
                         # Remove emoji and extra spaces
-                        clean_date = re.sub(r'📸.*$', '', date_str).strip()
+                        clean_date = DATE_EMOJI_SUFFIX_PATTERN.sub('', date_str).strip()
                         
                         # Handle date ranges - use first date
                         if '–' in clean_date:
                             clean_date = clean_date.split('–')[0].strip()
                         
                         # Remove day of week
-                        clean_date = re.sub(r'^[A-Za-z]+,\s*', '', clean_date)
+                        clean_date = DATE_WEEKDAY_PREFIX_PATTERN.sub('', clean_date)
                         
                         # Add current year if not present
-                        if not re.search(r'\b20\d{2}\b', clean_date):
+                        if not DATE_YEAR_PATTERN.search(clean_date):
                             clean_date = f"{clean_date}, {datetime.now().year}"
                         
                         # Parse date
@@ -775,18 +863,25 @@ class RedisDataStore:
                     new_climbers.add(climber)
             
             # Update both the index and individual climber records
+            previous_new_climbers = self.redis.smembers("index:climbers:new")
             pipe = self.redis.pipeline()
             pipe.delete("index:climbers:new")
             if new_climbers:
                 pipe.sadd("index:climbers:new", *new_climbers)
+            if new_climbers != previous_new_climbers:
+                pipe.incr(ALBUMS_VERSION_KEY)
 
-            # Update individual climber records
-            for climber in first_appearance.keys():
+            # Update individual climber records, storing the display form of the first climb
+            # date ("Jul 15, 2024") so the crew listing never has to format it per request
+            for climber, first_date in first_appearance.items():
                 climber_key = f"climber:{climber}"
                 if self.redis.exists(climber_key):
                     is_new = climber in new_climbers
-                    pipe.hset(climber_key, "is_new", "true" if is_new else "false")
-                    pipe.hset(climber_key, "updated_at", datetime.now().isoformat())
+                    pipe.hset(climber_key, mapping={
+                        "is_new": "true" if is_new else "false",
+                        "first_climb_date": f"{first_date:%b} {first_date.day}, {first_date.year}",
+                        "updated_at": datetime.now().isoformat()
+                    })
 
             pipe.execute()
             
@@ -918,6 +1013,31 @@ class RedisDataStore:
         """Get all climbers with a specific achievement"""
         return list(self.redis.smembers(f"index:climbers:achievement:{achievement}"))
 
+    def _seed_version_counters(self) -> None:
+        """Start missing version counters from the current time in microseconds.
+
+        Workers cache response bodies by version number, so a counter that restarts at 0
+        after a flush could repeat a version a worker already holds stale data for.
+        """
+        base = time.time_ns() // 1000
+        pipe = self.redis.pipeline()
+        for key in VERSION_KEYS:
+            pipe.set(key, base, nx=True)
+        pipe.execute()
+
+    async def get_albums_version(self) -> int:
+        """Get the album listing version, bumped whenever album data shown in listings changes"""
+        return int(self.redis.get(ALBUMS_VERSION_KEY) or 0)
+
+    async def get_crew_version(self) -> tuple[int, int]:
+        """Get the (albums, climbers) versions that together identify the crew listing contents"""
+        albums_version, climbers_version = self.redis.mget(ALBUMS_VERSION_KEY, CLIMBERS_VERSION_KEY)
+        return int(albums_version or 0), int(climbers_version or 0)
+
+    async def get_new_climbers(self) -> Set[str]:
+        """Get the names of all climbers currently flagged as new"""
+        return self.redis.smembers("index:climbers:new")
+
     async def get_all_skills(self) -> List[str]:
         """Get all unique skills"""
         return sorted(list(self.redis.smembers("index:skills:all")))
@@ -938,11 +1058,34 @@ class RedisDataStore:
         if not climber_names:
             return []
 
-        climbers = []
+        # Fetch every climber's hash, sets and album index in one round trip
+        pipe = self.redis.pipeline()
         for name in climber_names:
-            climber = await self.get_climber(name)
-            if climber:
-                climbers.append(climber)
+            pipe.hgetall(f"climber:{name}")
+            pipe.smembers(f"climber:{name}:skills")
+            pipe.smembers(f"climber:{name}:tags")
+            pipe.smembers(f"climber:{name}:achievements")
+            pipe.smembers(f"index:albums:crew:{name}")
+        results = pipe.execute()
+        rows = [results[i:i + 5] for i in range(0, len(results), 5)]
+
+        # Then every referenced album's location in a second round trip
+        album_urls = list({url for row in rows for url in row[4]})
+        pipe = self.redis.pipeline()
+        for url in album_urls:
+            pipe.hget(f"album:{url}", "location")
+        album_locations = {
+            url: loc.strip() for url, loc in zip(album_urls, pipe.execute())
+            if loc and isinstance(loc, str) and loc.strip()
+        }
+
+        climbers = []
+        for name, (climber_data, skills, tags, achievements, climber_album_urls) in zip(climber_names, rows):
+            if not climber_data:
+                continue
+            locations_visited = sorted({album_locations[url] for url in climber_album_urls if url in album_locations})
+            climbers.append(self._build_climber(
+                name, climber_data, list(skills), list(tags), list(achievements), locations_visited))
 
         # Sort by level (highest first), then by name
         climbers.sort(key=lambda x: (-x["level"], x["name"]))
@@ -1280,6 +1423,7 @@ class RedisDataStore:
                 # Move reverse index membership
                 self.redis.srem(f"index:albums:location:{old_name}", url)
                 self.redis.sadd(f"index:albums:location:{new_name}", url)
+            self.redis.incr(ALBUMS_VERSION_KEY)
         # Cleanup: delete old hash and any now-empty reverse index set
         pipe = self.redis.pipeline()
         pipe.delete(old_key)
@@ -1381,6 +1525,7 @@ class RedisDataStore:
                         "updated_at": datetime.now().isoformat(),
                     })
                     self.redis.srem(f"index:albums:location:{loc_name}", url)
+            self.redis.incr(ALBUMS_VERSION_KEY)
 
         # Clean up ownership ties
         try:
@@ -1430,11 +1575,18 @@ class RedisDataStore:
         if not album_urls:
             return []
 
-        albums = []
+        # Fetch every album hash and crew set in one round trip
+        pipe = self.redis.pipeline()
         for url in album_urls:
-            album = await self.get_album(url)
-            if album:
-                albums.append(album)
+            pipe.hgetall(f"album:{url}")
+            pipe.smembers(f"album:{url}:crew")
+        results = pipe.execute()
+
+        albums = []
+        for album_data, crew in zip(results[::2], results[1::2]):
+            if album_data:
+                album_data["crew"] = list(crew)
+                albums.append(album_data)
 
         # Sort by album date (newest climbing dates first), fallback to updated_at for consistent order
         def parse_album_date_for_sort(date_str):
@@ -1442,19 +1594,20 @@ class RedisDataStore:
             if not date_str:
                 return "0000-00-00"  # Empty dates go to bottom
 
-            import re
-            from datetime import datetime
+            parsed_date = _parse_album_date_fast(date_str)
+            if parsed_date:
+                return parsed_date.strftime("%Y-%m-%d")
 
             try:
                 # Remove emoji and extra spaces
-                clean_date = re.sub(r'📸.*$', '', date_str).strip()
+                clean_date = DATE_EMOJI_SUFFIX_PATTERN.sub('', date_str).strip()
 
                 # Handle date ranges - use first date
                 if '–' in clean_date:
                     clean_date = clean_date.split('–')[0].strip()
 
                 # Remove day of week
-                clean_date = re.sub(r'^[A-Za-z]+,\s*', '', clean_date)
+                clean_date = DATE_WEEKDAY_PREFIX_PATTERN.sub('', clean_date)
 
                 # Add current year if not present
                 current_year = datetime.now().year
@@ -1472,7 +1625,6 @@ class RedisDataStore:
             if not updated_at_str:
                 return "0000-00-00T00:00:00"
             try:
-                from datetime import datetime
                 return datetime.fromisoformat(updated_at_str).isoformat()
             except Exception:
                 return "0000-00-00T00:00:00"
@@ -1492,11 +1644,11 @@ class RedisDataStore:
     async def store_image(self, image_type: str, identifier: str, image_data: bytes) -> str:
         """Store image and return Redis path"""
         image_key = f"image:{image_type}:{identifier}"
-        self.binary_redis.set(image_key, image_data)
 
-        # Set expiration for temp images
-        if image_type == "temp":
-            self.binary_redis.expire(image_key, 3600)  # 1 hour
+        # Temp images expire after 1 hour. Image payloads can be megabytes, so the
+        # blocking transfer runs in a worker thread instead of on the event loop
+        expiry = 3600 if image_type == "temp" else None
+        await asyncio.to_thread(self.binary_redis.set, image_key, image_data, ex=expiry)
 
         logger.info(f"Stored image: {image_key} ({len(image_data)} bytes)")
         return f"/redis-image/{image_type}/{identifier}"
@@ -1504,7 +1656,24 @@ class RedisDataStore:
     async def get_image(self, image_type: str, identifier: str) -> Optional[bytes]:
         """Get image data"""
         image_key = f"image:{image_type}:{identifier}"
-        return self.binary_redis.get(image_key)
+        return await asyncio.to_thread(self.binary_redis.get, image_key)
+
+    async def move_image(self, from_type: str, from_identifier: str, image_type: str, identifier: str) -> Optional[str]:
+        """Move an image server-side (e.g. temp -> climber) and return its new path, or None if missing"""
+        from_key = f"image:{from_type}:{from_identifier}"
+        image_key = f"image:{image_type}:{identifier}"
+
+        # RENAME keeps the source's TTL, so drop the temp expiry in the same transaction
+        pipe = self.binary_redis.pipeline()
+        pipe.rename(from_key, image_key)
+        pipe.persist(image_key)
+        try:
+            pipe.execute()
+        except redis.ResponseError:
+            return None
+
+        logger.info(f"Moved image: {from_key} -> {image_key}")
+        return f"/redis-image/{image_type}/{identifier}"
 
     async def delete_image(self, image_type: str, identifier: str) -> bool:
         """Delete an image"""
@@ -1517,13 +1686,28 @@ class RedisDataStore:
     async def cache_album_metadata(self, url: str, metadata: Dict, ttl: int = 300) -> None:
         """Cache album metadata"""
         cache_key = f"cache:album_meta:{hashlib.md5(url.encode()).hexdigest()}"
-        self.redis.setex(cache_key, ttl, json.dumps(metadata))
+        self.redis.setex(cache_key, ttl, orjson.dumps(metadata))
 
     async def get_cached_metadata(self, url: str) -> Optional[Dict]:
         """Get cached album metadata"""
         cache_key = f"cache:album_meta:{hashlib.md5(url.encode()).hexdigest()}"
         cached = self.redis.get(cache_key)
-        return json.loads(cached) if cached else None
+        return orjson.loads(cached) if cached else None
+
+    async def cache_enriched_albums(self, version: int, body: bytes, ttl: int = 3600) -> None:
+        """Share a serialized /enriched body built for an albums version with the other workers"""
+        # Stored on the binary connection so hits come back as bytes without a decode/encode round trip
+        self.binary_redis.setex(f"cache:albums_enriched:{version}", ttl, body)
+
+    async def get_cached_enriched_albums(self, version: int) -> Optional[bytes]:
+        """Get the serialized /enriched body for an albums version, if a worker already built it"""
+        return self.binary_redis.get(f"cache:albums_enriched:{version}")
+
+    # === LOCKS ===
+
+    async def acquire_lock(self, name: str, ttl: int) -> bool:
+        """Claim a named lock for ttl seconds; returns False if another worker holds it"""
+        return bool(self.redis.set(f"lock:{name}", datetime.now().isoformat(), nx=True, ex=ttl))
 
     # === MEMES ===
 
@@ -1553,6 +1737,7 @@ class RedisDataStore:
         # Update indexes
         self.redis.sadd("index:memes:all", meme_id)
         self.redis.sadd(f"index:memes:creator:{creator_id}", meme_id)
+        self.redis.incr(MEMES_VERSION_KEY)
 
         logger.info(f"Added meme: {meme_id} by {creator_id}")
 
@@ -1566,6 +1751,10 @@ class RedisDataStore:
 
         return meme_data
 
+    async def get_memes_version(self) -> int:
+        """Get the meme listing version, bumped whenever a meme is added or deleted"""
+        return int(self.redis.get(MEMES_VERSION_KEY) or 0)
+
     async def get_all_memes(self) -> List[Dict]:
         """Get all memes"""
         meme_ids = self.redis.smembers("index:memes:all")
@@ -1592,12 +1781,15 @@ class RedisDataStore:
     async def get_memes_by_creator(self, creator_id: str) -> List[Dict]:
         """Get all memes by a specific creator"""
         meme_ids = self.redis.smembers(f"index:memes:creator:{creator_id}")
-        memes = []
+        if not meme_ids:
+            return []
 
+        # Use pipeline to batch Redis calls
+        pipe = self.redis.pipeline()
         for meme_id in meme_ids:
-            meme_data = self.redis.hgetall(f"meme:{meme_id}")
-            if meme_data:
-                memes.append(meme_data)
+            pipe.hgetall(f"meme:{meme_id}")
+
+        memes = [meme_data for meme_data in pipe.execute() if meme_data]
 
         # Sort by creation date (newest first)
         memes.sort(key=lambda x: x.get("created_at", ""), reverse=True)
@@ -1620,6 +1812,7 @@ class RedisDataStore:
 
         # Delete meme data
         self.redis.delete(f"meme:{meme_id}")
+        self.redis.incr(MEMES_VERSION_KEY)
 
         logger.info(f"Deleted meme: {meme_id}")
         return True
@@ -1629,13 +1822,13 @@ class RedisDataStore:
     async def store_session(self, session_id: str, user_data: Dict, ttl: int = 604800) -> None:
         """Store session with TTL (default 7 days)"""
         session_key = f"session:{session_id}"
-        self.redis.setex(session_key, ttl, json.dumps(user_data))
+        self.redis.setex(session_key, ttl, orjson.dumps(user_data))
 
     async def get_session(self, session_id: str) -> Optional[Dict]:
         """Get session data"""
         session_key = f"session:{session_id}"
         session_data = self.redis.get(session_key)
-        return json.loads(session_data) if session_data else None
+        return orjson.loads(session_data) if session_data else None
 
     async def delete_session(self, session_id: str) -> bool:
         """Delete session"""
@@ -1823,8 +2016,8 @@ class RedisDataStore:
             return None
 
         try:
-            return json.loads(subscription_data)
-        except json.JSONDecodeError:
+            return orjson.loads(subscription_data)
+        except orjson.JSONDecodeError:
             logger.error(f"Failed to parse device subscription data for {device_id}")
             return None
 
@@ -1838,14 +2031,9 @@ class RedisDataStore:
         if not device_ids:
             return []
 
-        # Get subscription for each device
-        subscriptions = []
-        for device_id in device_ids:
-            subscription = await self.get_device_push_subscription(device_id)
-            if subscription:
-                subscriptions.append(subscription)
-
-        return subscriptions
+        # Fetch every device's subscription in one round trip
+        return self._decode_subscriptions(
+            self.redis.mget([f"device:{device_id}:subscription" for device_id in device_ids]))
 
     async def get_all_device_push_subscriptions(self) -> List[Dict[str, Any]]:
         """Get all device push subscriptions"""
@@ -1853,12 +2041,21 @@ class RedisDataStore:
         if not subscription_ids:
             return []
 
-        subscriptions = []
-        for subscription_id in subscription_ids:
-            subscription = await self.get_push_subscription(subscription_id)
-            if subscription:
-                subscriptions.append(subscription)
+        # Fetch every subscription in one round trip (this runs on every notification fan-out)
+        return self._decode_subscriptions(
+            self.redis.mget([f"push_subscription:{subscription_id}" for subscription_id in subscription_ids]))
 
+    @staticmethod
+    def _decode_subscriptions(raw_subscriptions: List[Optional[str]]) -> List[Dict[str, Any]]:
+        """Parse stored subscription JSON, skipping missing or corrupt entries"""
+        subscriptions = []
+        for subscription_data in raw_subscriptions:
+            if not subscription_data:
+                continue
+            try:
+                subscriptions.append(orjson.loads(subscription_data))
+            except orjson.JSONDecodeError:
+                logger.error("Failed to parse stored push subscription data")
         return subscriptions
 
     async def delete_device_push_subscription(self, device_id: str) -> bool:
@@ -1964,8 +2161,8 @@ class RedisDataStore:
             return None
 
         try:
-            return json.loads(subscription_data)
-        except json.JSONDecodeError:
+            return orjson.loads(subscription_data)
+        except orjson.JSONDecodeError:
             logger.error(f"Failed to parse subscription data for {subscription_id}")
             return None
 
@@ -2276,4 +2473,5 @@ class RedisDataStore:
         """Clear all data - USE WITH CAUTION"""
         self.redis.flushdb()
         self.binary_redis.flushdb()
+        self._seed_version_counters()
         logger.warning("All Redis data cleared!")
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 from fastapi import APIRouter, HTTPException, Depends, Form, UploadFile, File
@@ -16,7 +17,7 @@ from utils.export_utils import export_redis_database
 from utils.background_tasks import perform_album_metadata_refresh
 from routes.notifications import send_push_notification_to_subscriptions
 from config import settings
-from validation import validate_image_file
+from validation import validate_image_file, read_image_upload
 
 logger = logging.getLogger("climbing_app")
 router = APIRouter(prefix="/api/admin", tags=["admin"])
@@ -854,18 +855,15 @@ async def upload_notification_image(
     if not image.content_type or not image.content_type.startswith('image/'):
         raise HTTPException(status_code=400, detail="File must be an image")
 
-    # Check file size (5MB limit for upload)
-    MAX_UPLOAD_SIZE = 5 * 1024 * 1024  # 5MB
-    content = await image.read()
-    if len(content) > MAX_UPLOAD_SIZE:
-        raise HTTPException(status_code=400, detail="Image must be less than 5MB")
+    # Read in bounded chunks (5MB limit for upload)
+    content = await read_image_upload(image)
 
     # Validate image file
     validate_image_file(image.content_type, len(content))
 
     try:
-        # Optimize image for notifications (resize and compress)
-        optimized_data = optimize_notification_image(content)
+        # Optimize image for notifications (resize and compress) off the event loop
+        optimized_data = await asyncio.to_thread(optimize_notification_image, content)
 
         # Generate unique identifier
         image_hash = hashlib.md5(content + str(datetime.now().timestamp()).encode()).hexdigest()
@@ -1,12 +1,12 @@
-import json
+import asyncio
 import logging
-import httpx
+import orjson
 from typing import List
-from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Query
 from fastapi.responses import JSONResponse, Response
 
 from auth import get_current_user, require_auth, get_current_user_hybrid, require_auth_hybrid
-from dependencies import get_redis_store, get_permissions_manager
+from dependencies import get_redis_store, get_permissions_manager, get_http_client
 from models.api_models import AlbumSubmission, AlbumCrewEdit, AlbumMetadataUpdate
 from permissions import ResourceType
 from utils.metadata_parser import fetch_url, parse_meta_tags
@@ -18,10 +18,18 @@ from routes.notifications import send_notification_for_event
 logger = logging.getLogger("climbing_app")
 router = APIRouter(prefix="/api/albums", tags=["albums"])
 
+_ENRICHED_CACHE_HEADERS = {
+    "Cache-Control": "public, max-age=30, stale-while-revalidate=300"
+}
+
+# Serialized /enriched body and the album listing version it was built from (per worker)
+_enriched_albums_cache: tuple[int, bytes] | None = None
+
 
 @router.get("/enriched")
 async def get_enriched_albums():
     """API endpoint that returns all albums with metadata from Redis."""
+    global _enriched_albums_cache
     redis_store = get_redis_store()
 
     if not redis_store:
@@ -29,19 +37,30 @@ async def get_enriched_albums():
         raise HTTPException(status_code=503, detail="Database unavailable")
 
     try:
+        # Serve the cached body while no album, crew or new-climber write has happened since it was built
+        version = await redis_store.get_albums_version()
+        if _enriched_albums_cache is not None and _enriched_albums_cache[0] == version:
+            return Response(content=_enriched_albums_cache[1], media_type="application/json",
+                            headers=_ENRICHED_CACHE_HEADERS)
+
+        # Another worker may already have built this version
+        body = await redis_store.get_cached_enriched_albums(version)
+        if body is not None:
+            _enriched_albums_cache = (version, body)
+            return Response(content=body, media_type="application/json", headers=_ENRICHED_CACHE_HEADERS)
+
         albums = await redis_store.get_all_albums()
+        # Fetch the new-climber set once instead of loading every crew member's full record
+        new_climbers = await redis_store.get_new_climbers()
         enriched_albums = []
 
         for album in albums:
             # Create enriched metadata with crew status
             crew_with_status = []
             for crew_member in album.get("crew", []):
-                climber_data = await redis_store.get_climber(crew_member)
-                is_new = climber_data.get("is_new", False) if climber_data else False
-
                 crew_with_status.append({
                     "name": crew_member,
-                    "is_new": is_new,
+                    "is_new": crew_member in new_climbers,
                     "image_url": f"/redis-image/climber/{crew_member}/face"
                 })
 
@@ -58,10 +77,10 @@ async def get_enriched_albums():
                 }
             })
 
-        headers = {
-            "Cache-Control": "public, max-age=30, stale-while-revalidate=300"
-        }
-        return Response(content=json.dumps(enriched_albums), media_type="application/json", headers=headers)
+        body = orjson.dumps(enriched_albums)
+        await redis_store.cache_enriched_albums(version, body)
+        _enriched_albums_cache = (version, body)
+        return Response(content=body, media_type="application/json", headers=_ENRICHED_CACHE_HEADERS)
 
     except Exception as e:
         logger.error(f"Error getting enriched albums: {e}")
@@ -98,9 +117,8 @@ async def validate_album_url(url: str = Query(...)):
 
         # Try to fetch metadata to validate accessibility
         try:
-            async with httpx.AsyncClient() as client:
-                response = await fetch_url(client, validated_url)
-                metadata = parse_meta_tags(response.text, validated_url)
+            response = await fetch_url(get_http_client(), validated_url)
+            metadata = parse_meta_tags(response.text, validated_url)
 
             return JSONResponse({
                 "valid": True,
@@ -128,7 +146,11 @@ async def validate_album_url(url: str = Query(...)):
 
 
 @router.post("/submit")
-async def submit_album(submission: AlbumSubmission, user: dict = Depends(get_current_user_hybrid)):
+async def submit_album(
+    submission: AlbumSubmission,
+    background_tasks: BackgroundTasks,
+    user: dict = Depends(get_current_user_hybrid)
+):
     """Submit a new album directly to Redis (no GitHub).
     
     Supports both session-based authentication (web) and JWT Bearer token authentication (API).
@@ -172,49 +194,54 @@ async def submit_album(submission: AlbumSubmission, user: dict = Depends(get_cur
                     detail="You don't have permission to create albums. Please contact an administrator.")
 
         # Check if album already exists
-        existing_album = await redis_store.get_album(submission.url)
-        if existing_album:
+        if await redis_store.album_exists(submission.url):
             raise HTTPException(status_code=400, detail="Album already exists")
 
-        # Validate crew members exist or create new ones
-        new_created_climbers = []
-        for crew_name in (submission.crew or []):
-            # Check if this person is in new_people
-            new_person = next((p for p in (submission.new_people or []) if p.name == crew_name), None)
-            if new_person:
-                # Create new climber
-                try:
-                    await redis_store.add_climber(
-                        name=new_person.name,
-                        location=new_person.location,
-                        skills=new_person.skills,
-                        achievements=new_person.achievements
-                    )
-                    new_created_climbers.append(new_person)
-
-                    # Handle image if provided
-                    if new_person.temp_image_path:
-                        # Extract temp image from Redis and store as climber image
-                        temp_image = await redis_store.get_image("temp", new_person.name)
-                        if temp_image:
-                            await redis_store.store_image("climber", f"{new_person.name}/face", temp_image)
-                            await redis_store.delete_image("temp", new_person.name)
-
-                except ValueError as e:
-                    if "already exists" in str(e):
-                        pass  # Climber already exists, continue
-                    else:
-                        raise
-            else:
-                # Check if existing crew member exists
-                existing_climber = await redis_store.get_climber(crew_name)
-                if not existing_climber:
+        # Start fetching album metadata from Google Photos while the crew is checked and created
+        metadata_fetch = asyncio.create_task(fetch_url(get_http_client(), submission.url))
+        # Mark a failed fetch as observed in case we bail out before awaiting it
+        metadata_fetch.add_done_callback(lambda task: task.cancelled() or task.exception())
+        try:
+            # Fail fast on unknown crew members before creating anything
+            new_people_by_name = {p.name: p for p in (submission.new_people or [])}
+            existing_names = [name for name in (submission.crew or []) if name not in new_people_by_name]
+            for crew_name, exists in zip(existing_names, await redis_store.climbers_exist(existing_names)):
+                if not exists:
                     raise HTTPException(status_code=400, detail=f"Crew member '{crew_name}' does not exist")
 
-        # Fetch album metadata
-        async with httpx.AsyncClient() as client:
-            response = await fetch_url(client, submission.url)
-            metadata = parse_meta_tags(response.text, submission.url)
+            # Create new crew members
+            new_created_climbers = []
+            for crew_name in (submission.crew or []):
+                # Check if this person is in new_people
+                new_person = new_people_by_name.get(crew_name)
+                if new_person:
+                    # Create new climber
+                    try:
+                        await redis_store.add_climber(
+                            name=new_person.name,
+                            location=new_person.location,
+                            skills=new_person.skills,
+                            achievements=new_person.achievements
+                        )
+                        new_created_climbers.append(new_person)
+
+                        # Handle image if provided
+                        if new_person.temp_image_path:
+                            # Promote the temp upload to the climber image without copying it through the app
+                            await redis_store.move_image("temp", new_person.name, "climber", f"{new_person.name}/face")
+
+                    except ValueError as e:
+                        if "already exists" in str(e):
+                            pass  # Climber already exists, continue
+                        else:
+                            raise
+
+            response = await metadata_fetch
+        finally:
+            # Don't leave the fetch running if crew validation or creation failed
+            metadata_fetch.cancel()
+
+        metadata = parse_meta_tags(response.text, submission.url)
 
         # Add album to Redis
         await redis_store.add_album(submission.url, submission.crew, metadata, location=submission.location)
@@ -227,43 +254,39 @@ async def submit_album(submission: AlbumSubmission, user: dict = Depends(get_cur
             except Exception as e:
                 logger.warning(f"Failed to set resource ownership: {e}")
 
-        # Send notification for new album
-        try:
-            await send_notification_for_event(
-                event_type="album_created",
+        # Send notification for new album once the response is out (push fan-out can take seconds)
+        background_tasks.add_task(
+            send_notification_for_event,
+            event_type="album_created",
+            event_data={
+                "title": metadata.get('title', 'New Album'),
+                "url": submission.url,
+                "crew": submission.crew,
+                "creator": user.get("name", "Someone"),
+                "image_url": metadata.get('imageUrl')  # Include album cover for notification icon
+            },
+            redis_store=redis_store,
+            target_users=None  # Notify all users
+        )
+
+        # Send notification for each new crew member added during album creation
+        for new_person in new_created_climbers:
+            # Generate image URL for notification
+            image_url = f"/redis-image/climber/{new_person.name}/face"
+
+            background_tasks.add_task(
+                send_notification_for_event,
+                event_type="crew_member_added",
                 event_data={
-                    "title": metadata.get('title', 'New Album'),
-                    "url": submission.url,
-                    "crew": submission.crew,
+                    "name": new_person.name,
                     "creator": user.get("name", "Someone"),
-                    "image_url": metadata.get('imageUrl')  # Include album cover for notification icon
+                    "skills": new_person.skills,
+                    "location": new_person.location,
+                    "image_url": image_url
                 },
                 redis_store=redis_store,
                 target_users=None  # Notify all users
             )
-        except Exception as e:
-            logger.warning(f"Failed to send album notification: {e}")
-
-        # Send notification for each new crew member added during album creation
-        for new_person in new_created_climbers:
-            try:
-                # Generate image URL for notification
-                image_url = f"/redis-image/climber/{new_person.name}/face"
-
-                await send_notification_for_event(
-                    event_type="crew_member_added",
-                    event_data={
-                        "name": new_person.name,
-                        "creator": user.get("name", "Someone"),
-                        "skills": new_person.skills,
-                        "location": new_person.location,
-                        "image_url": image_url
-                    },
-                    redis_store=redis_store,
-                    target_users=None  # Notify all users
-                )
-            except Exception as e:
-                logger.warning(f"Failed to send crew member notification for {new_person.name}: {e}")
 
         return JSONResponse({
             "success": True,
@@ -281,7 +304,10 @@ async def submit_album(submission: AlbumSubmission, user: dict = Depends(get_cur
 
 
 @router.post("/edit-crew")
-async def edit_album_crew(edit_data: AlbumCrewEdit, user: dict = Depends(require_auth_hybrid)):
+async def edit_album_crew(
+    edit_data: AlbumCrewEdit,
+    user: dict = Depends(require_auth_hybrid)
+):
     """Edit crew members for an album.
     
     Supports both session-based authentication (web) and JWT Bearer token authentication (API).
@@ -363,14 +389,10 @@ async def edit_album_crew(edit_data: AlbumCrewEdit, user: dict = Depends(require
 
                     # Handle image if provided
                     if person.temp_image_path:
-                        temp_image = await redis_store.get_image("temp", validated_name)
-                        if temp_image:
-                            # Store as climber image
-                            image_path = await redis_store.store_image("climber", f"{validated_name}/face", temp_image)
+                        # Promote the temp upload to the climber image without copying it through the app
+                        image_path = await redis_store.move_image("temp", validated_name, "climber", f"{validated_name}/face")
+                        if image_path:
                             uploaded_images.append(("climber", f"{validated_name}/face"))
-
-                            # Clean up temp image
-                            await redis_store.delete_image("temp", validated_name)
                         else:
                             logger.warning(f"Temporary image not found for {validated_name}")
 
@@ -381,13 +403,12 @@ async def edit_album_crew(edit_data: AlbumCrewEdit, user: dict = Depends(require
                     raise HTTPException(status_code=500, detail=f"Failed to create climber {validated_name}")
 
             # Validate that all crew members exist
-            for crew_member in validated_crew:
-                existing_climber = await redis_store.get_climber(crew_member)
-                if not existing_climber:
+            for crew_member, exists in zip(validated_crew, await redis_store.climbers_exist(validated_crew)):
+                if not exists:
                     raise HTTPException(status_code=400, detail=f"Crew member '{crew_member}' does not exist")
 
             # Update album crew (atomic operation)
-            await redis_store.update_album_crew(validated_url, validated_crew)
+            await redis_store.update_album_crew(validated_url, validated_crew, current_album=existing_album)
 
             return JSONResponse({
                 "success": True,
@@ -404,14 +425,14 @@ async def edit_album_crew(edit_data: AlbumCrewEdit, user: dict = Depends(require
             for climber_name in created_climbers:
                 try:
                     await redis_store.delete_climber(climber_name)
-                except:
-                    pass
+                except Exception as cleanup_error:
+                    logger.warning(f"Failed to clean up climber {climber_name}: {cleanup_error}")
 
             for image_type, image_id in uploaded_images:
                 try:
                     await redis_store.delete_image(image_type, image_id)
-                except:
-                    pass
+                except Exception as cleanup_error:
+                    logger.warning(f"Failed to clean up image {image_type}:{image_id}: {cleanup_error}")
 
             raise
 
@@ -1,6 +1,5 @@
 import datetime
 import logging
-import httpx
 from typing import Optional, Dict, List
 from fastapi import APIRouter, HTTPException, Depends, Request, status
 from fastapi.responses import RedirectResponse, JSONResponse
@@ -8,7 +7,7 @@ from pydantic import BaseModel
 
 from auth import oauth_handler, get_current_user
 from config import settings
-from dependencies import get_redis_store, get_permissions_manager, get_jwt_manager
+from dependencies import get_redis_store, get_permissions_manager, get_jwt_manager, get_http_client
 
 logger = logging.getLogger("climbing_app")
 router = APIRouter(prefix="/auth", tags=["authentication"])
@@ -84,19 +83,18 @@ async def auth_callback(code: Optional[str] = None, state: Optional[str] = None,
         if profile_picture_url:
             try:
                 # Fetch and cache the profile picture
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(profile_picture_url)
-                    if response.status_code == 200 and redis_store:
-                        # Store in Redis with user ID as identifier
-                        image_path = await redis_store.store_image(
-                            "profile",
-                            f"{user_info['id']}/picture",
-                            response.content
-                        )
-                        # Update picture URL to use our cached version
-                        user_info["picture"] = image_path
-                    else:
-                        logger.warning(f"Failed to fetch profile picture: {response.status_code}")
+                response = await get_http_client().get(profile_picture_url)
+                if response.status_code == 200 and redis_store:
+                    # Store in Redis with user ID as identifier
+                    image_path = await redis_store.store_image(
+                        "profile",
+                        f"{user_info['id']}/picture",
+                        response.content
+                    )
+                    # Update picture URL to use our cached version
+                    user_info["picture"] = image_path
+                else:
+                    logger.warning(f"Failed to fetch profile picture: {response.status_code}")
             except Exception as e:
                 logger.warning(f"Failed to cache profile picture: {e}")
 
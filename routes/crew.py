@@ -1,6 +1,8 @@
 import logging
-from fastapi import APIRouter, HTTPException, Depends, Form, File, UploadFile, Query
-from fastapi.responses import JSONResponse
+import time
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, Form, File, UploadFile, Query
+from fastapi.responses import JSONResponse, Response
 
 from auth import get_current_user, get_current_user_hybrid, require_auth_hybrid
 from dependencies import get_redis_store, get_permissions_manager
@@ -17,10 +19,20 @@ from routes.notifications import send_notification_for_event
 logger = logging.getLogger("climbing_app")
 router = APIRouter(prefix="/api/crew", tags=["crew"])
 
+# The "new" window is time-based, so recheck periodically even without album writes
+NEW_CLIMBERS_RECHECK_SECONDS = 3600
+
+# Album listing version and monotonic time of the last new-climber calculation (per worker)
+_new_climbers_checked: tuple[int, float] | None = None
+
+# Serialized crew listing and the (albums, climbers) versions it was built from (per worker)
+_crew_cache: tuple[tuple[int, int], bytes] | None = None
+
 
 @router.get("")
 async def get_crew():
     """Get all crew members from Redis"""
+    global _new_climbers_checked, _crew_cache
     redis_store = get_redis_store()
 
     if not redis_store:
@@ -28,15 +40,28 @@ async def get_crew():
         raise HTTPException(status_code=503, detail="Database unavailable")
 
     try:
-        # Try to calculate new climbers, but don't fail if it errors
+        # Try to calculate new climbers, but don't fail if it errors. The full album
+        # scan only reruns after an album write or once the recheck interval has passed
         try:
-            await redis_store.calculate_new_climbers()
+            version = await redis_store.get_albums_version()
+            if (_new_climbers_checked is None or _new_climbers_checked[0] != version or
+                    time.monotonic() - _new_climbers_checked[1] > NEW_CLIMBERS_RECHECK_SECONDS):
+                await redis_store.calculate_new_climbers()
+                # The calculation bumps the version itself when the new set changes
+                _new_climbers_checked = (await redis_store.get_albums_version(), time.monotonic())
         except Exception as e:
             logger.warning(f"Error calculating new climbers: {e}")
             # Continue anyway - we can still return crew data
 
+        # Serve the cached body while no album or climber write has happened since it was built
+        crew_version = await redis_store.get_crew_version()
+        if _crew_cache is not None and _crew_cache[0] == crew_version:
+            return Response(content=_crew_cache[1], media_type="application/json")
+
         crew = await redis_store.get_all_climbers()
-        return JSONResponse(crew)
+        body = orjson.dumps(crew)
+        _crew_cache = (crew_version, body)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting crew: {e}")
         raise HTTPException(status_code=500, detail="Unable to retrieve crew member data. Please try again later.")
@@ -79,6 +104,7 @@ async def calculate_new_climbers_endpoint(user: dict = Depends(get_current_user)
 
 @router.post("/submit")
 async def submit_crew_member(
+    background_tasks: BackgroundTasks,
     name: str = Form(...),
     skills: str = Form(default="[]"),
     location: str = Form(default="[]"),
@@ -160,25 +186,23 @@ async def submit_crew_member(
             except Exception as e:
                 logger.warning(f"Failed to set ownership/increment count: {e}")
 
-        # Send notification for new crew member
-        try:
-            # Generate image URL for notification
-            image_url = f"/redis-image/climber/{validated_name}/face"
-
-            await send_notification_for_event(
-                event_type="crew_member_added",
-                event_data={
-                    "name": validated_name,
-                    "creator": user.get("name", "Someone"),
-                    "skills": validated_skills,
-                    "location": validated_location,
-                    "image_url": image_url  # Include image URL for the notification
-                },
-                redis_store=redis_store,
-                target_users=None  # Notify all users
-            )
-        except Exception as e:
-            logger.warning(f"Failed to send crew member notification: {e}")
+        # Send notification for new crew member once the response is out (push fan-out can take seconds)
+        # Generate image URL for notification
+        image_url = f"/redis-image/climber/{validated_name}/face"
+
+        background_tasks.add_task(
+            send_notification_for_event,
+            event_type="crew_member_added",
+            event_data={
+                "name": validated_name,
+                "creator": user.get("name", "Someone"),
+                "skills": validated_skills,
+                "location": validated_location,
+                "image_url": image_url  # Include image URL for the notification
+            },
+            redis_store=redis_store,
+            target_users=None  # Notify all users
+        )
 
         return JSONResponse({
             "success": True,
@@ -424,7 +448,9 @@ async def add_skills_to_crew_member(request: AddSkillsRequest, user: dict = Depe
 
         # Get current skills and add new ones
         current_skills = existing_member.get("skills", [])
-        updated_skills = current_skills + [skill for skill in request.skills if skill not in current_skills]
+        current_skill_set = set(current_skills)
+        added_skills = [skill for skill in request.skills if skill not in current_skill_set]
+        updated_skills = current_skills + added_skills
 
         # Update climber with new skills
         await redis_store.update_climber(
@@ -438,7 +464,7 @@ async def add_skills_to_crew_member(request: AddSkillsRequest, user: dict = Depe
             "success": True,
             "message": f"Skills added to {request.crew_name} successfully!",
             "crew_name": request.crew_name,
-            "added_skills": [skill for skill in request.skills if skill not in current_skills]
+            "added_skills": added_skills
         })
 
     except HTTPException:
@@ -483,8 +509,10 @@ async def add_achievements_to_crew_member(request: AddAchievementsRequest, user:
 
         # Get current achievements and add new ones
         current_achievements = existing_member.get("achievements", [])
-        updated_achievements = current_achievements + [
-            achievement for achievement in request.achievements if achievement not in current_achievements]
+        current_achievement_set = set(current_achievements)
+        added_achievements = [
+            achievement for achievement in request.achievements if achievement not in current_achievement_set]
+        updated_achievements = current_achievements + added_achievements
 
         # Update climber with new achievements
         await redis_store.update_climber(
@@ -500,7 +528,7 @@ async def add_achievements_to_crew_member(request: AddAchievementsRequest, user:
             "success": True,
             "message": f"Achievements added to {request.crew_name} successfully!",
             "crew_name": request.crew_name,
-            "added_achievements": [achievement for achievement in request.achievements if achievement not in current_achievements]
+            "added_achievements": added_achievements
         })
 
     except HTTPException:
@@ -1,6 +1,7 @@
 import logging
+import orjson
 from fastapi import APIRouter, HTTPException, Depends, Query
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 
 from auth import get_current_user
 from dependencies import get_redis_store, get_permissions_manager
@@ -22,7 +23,7 @@ async def get_skills():
     
     try:
         skills = await redis_store.get_all_skills()
-        return JSONResponse(skills)
+        return Response(content=orjson.dumps(skills), media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting skills: {e}")
         raise HTTPException(status_code=500, detail="Failed to get skills")
@@ -141,7 +142,7 @@ async def get_locations(user: dict = Depends(get_current_user)):
                     except Exception:
                         loc["owners"] = []
 
-        return JSONResponse(locations)
+        return Response(content=orjson.dumps(locations), media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting locations: {e}")
         raise HTTPException(status_code=500, detail="Failed to get locations")
@@ -160,7 +161,7 @@ async def get_location_attributes():
 
     try:
         attributes = await redis_store.get_all_location_attributes()
-        return JSONResponse(attributes)
+        return Response(content=orjson.dumps(attributes), media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting location attributes: {e}")
         raise HTTPException(status_code=500, detail="Failed to get location attributes")
@@ -554,7 +555,7 @@ async def get_achievements():
     
     try:
         achievements = await redis_store.get_all_achievements()
-        return JSONResponse(achievements)
+        return Response(content=orjson.dumps(achievements), media_type="application/json")
     except Exception as e:
         logger.error(f"Error getting achievements: {e}")
         raise HTTPException(status_code=500, detail="Failed to get achievements")
@@ -1,7 +1,8 @@
 import logging
 import uuid
-from fastapi import APIRouter, HTTPException, Depends, File, UploadFile
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Depends, File, UploadFile
+from fastapi.responses import JSONResponse, Response
 
 from auth import get_current_user
 from dependencies import get_redis_store, get_permissions_manager
@@ -12,10 +13,14 @@ from routes.notifications import send_notification_for_event
 logger = logging.getLogger("climbing_app")
 router = APIRouter(prefix="/api/memes", tags=["memes"])
 
+# Serialized meme listing and the meme version it was built from (per worker)
+_memes_cache: tuple[int, bytes] | None = None
+
 
 @router.get("")
 async def get_memes():
     """Get all memes from Redis"""
+    global _memes_cache
     redis_store = get_redis_store()
 
     if not redis_store:
@@ -23,6 +28,11 @@ async def get_memes():
         raise HTTPException(status_code=503, detail="Database unavailable")
 
     try:
+        # Serve the cached body while no meme has been added or deleted since it was built
+        version = await redis_store.get_memes_version()
+        if _memes_cache is not None and _memes_cache[0] == version:
+            return Response(content=_memes_cache[1], media_type="application/json")
+
         memes = await redis_store.get_all_memes()
 
         # Convert to format expected by frontend
@@ -34,7 +44,9 @@ async def get_memes():
                 "created_at": meme["created_at"]
             })
 
-        return JSONResponse(memes_data)
+        body = orjson.dumps(memes_data)
+        _memes_cache = (version, body)
+        return Response(content=body, media_type="application/json")
 
     except Exception as e:
         logger.error(f"Error getting memes: {e}")
@@ -43,6 +55,7 @@ async def get_memes():
 
 @router.post("/submit")
 async def submit_meme(
+    background_tasks: BackgroundTasks,
     image: UploadFile = File(...),
     user: dict = Depends(get_current_user)
 ):
@@ -101,20 +114,18 @@ async def submit_meme(
         await permissions_manager.set_resource_owner(ResourceType.MEME, meme_id, user_id)
         await permissions_manager.increment_user_creation_count(user_id, ResourceType.MEME)
 
-        # Send notification for new meme
-        try:
-            await send_notification_for_event(
-                event_type="meme_uploaded",
-                event_data={
-                    "meme_id": meme_id,
-                    "creator": user.get("name", "Someone"),
-                    "creator_id": user_id
-                },
-                redis_store=redis_store,
-                target_users=None  # Notify all users
-            )
-        except Exception as e:
-            logger.warning(f"Failed to send meme notification: {e}")
+        # Send notification for new meme once the response is out (push fan-out can take seconds)
+        background_tasks.add_task(
+            send_notification_for_event,
+            event_type="meme_uploaded",
+            event_data={
+                "meme_id": meme_id,
+                "creator": user.get("name", "Someone"),
+                "creator_id": user_id
+            },
+            redis_store=redis_store,
+            target_users=None  # Notify all users
+        )
 
         return JSONResponse({
             "success": True,
@@ -1,5 +1,6 @@
 import json
 import logging
+import orjson
 import base64
 import asyncio
 from datetime import datetime
@@ -1200,8 +1201,8 @@ async def send_push_notification_to_subscriptions(
 
         # Validate and optimize payload before sending
         optimized_payload = optimize_notification_payload(notification_data)
-        payload_json = json.dumps(optimized_payload)
-        payload_size = len(payload_json.encode('utf-8'))
+        payload_json = orjson.dumps(optimized_payload)
+        payload_size = len(payload_json)
 
         logger.debug(f"Optimized FCM payload size: {payload_size} bytes")
         
@@ -1223,8 +1224,8 @@ async def send_push_notification_to_subscriptions(
                     "type": "truncated_notification"
                 }
             }
-            payload_json = json.dumps(optimized_payload)
-            logger.info(f"Fallback payload size: {len(payload_json.encode('utf-8'))} bytes")
+            payload_json = orjson.dumps(optimized_payload)
+            logger.info(f"Fallback payload size: {len(payload_json)} bytes")
 
         # Set timeout for HTTP requests
         timeout = aiohttp.ClientTimeout(total=30, connect=10)
@@ -1320,7 +1321,7 @@ async def send_push_notification_to_subscriptions(
                                     error_text = ""
                                     try:
                                         error_text = await response.text()
-                                    except:
+                                    except (aiohttp.ClientError, UnicodeDecodeError):
                                         error_text = "Could not read error response"
                                     
                                     logger.warning(
@@ -1381,7 +1382,7 @@ def optimize_notification_payload(payload: Dict[str, Any]) -> Dict[str, Any]:
         optimized["body"] = optimized["body"][:197] + "..."
     
     # Remove large data fields if payload is getting too big
-    current_size = len(json.dumps(optimized).encode('utf-8'))
+    current_size = len(orjson.dumps(optimized))
     
     if current_size > 3000:  # 3KB threshold for optimization
         # Remove non-essential data
@@ -1441,14 +1442,14 @@ async def send_notification_for_event(
             for subscription in all_subscriptions:
                 preferences_json = subscription.get("notification_preferences", "{}")
                 try:
-                    preferences = json.loads(preferences_json)
+                    preferences = orjson.loads(preferences_json)
                     # Check if this device wants this type of notification
                     if preferences.get(event_type, True):  # Default to True if preference not set
                         filtered_subscriptions.append(subscription)
                     else:
                         logger.debug(
                             f"Skipping {event_type} notification for device {subscription.get('device_id', 'unknown')[:15]}... (disabled by user)")
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     # If preferences can't be parsed, send notification (fail-safe)
                     filtered_subscriptions.append(subscription)
 
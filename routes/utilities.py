@@ -4,7 +4,9 @@ from fastapi.responses import JSONResponse, RedirectResponse, Response, FileResp
 
 from auth import get_current_user
 from dependencies import get_redis_store, get_permissions_manager
-from validation import ValidationError, validate_name, validate_image_file
+from validation import (
+    ValidationError, validate_name, validate_image_file, validate_image_extension, read_image_upload
+)
 
 logger = logging.getLogger("climbing_app")
 router = APIRouter(prefix="/api", tags=["utilities"])
@@ -121,8 +123,9 @@ async def upload_face_image(
         raise HTTPException(status_code=400, detail="Please upload a valid image file")
 
     try:
-        # Validate image file type and size
-        image_data = await file.read()
+        # Validate image file type and size, reading in bounded chunks
+        validate_image_extension(file.filename)
+        image_data = await read_image_upload(file)
         validate_image_file(file.content_type, len(image_data))
 
         # Store as temporary image in Redis (expires after 1 hour)
@@ -135,6 +138,8 @@ async def upload_face_image(
             "person_name": validated_name
         })
 
+    except HTTPException:
+        raise
     except ValidationError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
@@ -1,3 +1,3 @@
 #!/bin/sh
 
-uv run uvicorn main:app --reload --host 0.0.0.0 --port 8001 --reload-exclude '*.log'
+uv run uvicorn main:app --reload --host 0.0.0.0 --port 8001 --loop uvloop --http httptools --reload-exclude '*.log'
@@ -0,0 +1,23 @@
+from datetime import datetime
+
+from redis_store import _parse_album_date_fast
+
+
+def test_parses_google_photos_date():
+    assert _parse_album_date_fast("Sat, Jun 7, 2024 📸") == datetime(2024, 6, 7)
+
+
+def test_parses_full_month_names_and_sept():
+    assert _parse_album_date_fast("7 September 2023") == datetime(2023, 9, 7)
+    assert _parse_album_date_fast("Sept 3, 2022") == datetime(2022, 9, 3)
+
+
+def test_range_uses_first_date_and_trailing_year():
+    assert _parse_album_date_fast("Oct 30 – Nov 2, 2023") == datetime(2023, 10, 30)
+
+
+def test_word_with_month_prefix_is_not_a_month():
+    # "Marathon" starts with "Mar" but only the exact "Jun" token is a month
+    assert _parse_album_date_fast("Marathon 12 Jun 2024") == datetime(2024, 6, 12)
+    assert _parse_album_date_fast("Junior 5") is None
+    assert _parse_album_date_fast("Decathlon 3, 2024") is None
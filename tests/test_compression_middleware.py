@@ -0,0 +1,17 @@
+from middleware.compression_middleware import choose_encoding, parse_accept_encoding
+
+
+def test_parses_q_values():
+    assert parse_accept_encoding("gzip;q=0.5, br;q=0") == {"gzip": 0.5, "br": 0.0}
+
+
+def test_malformed_q_counts_as_one():
+    assert parse_accept_encoding("gzip;q=abc, br") == {"gzip": 1.0, "br": 1.0}
+
+
+def test_choose_encoding_prefers_br_and_honours_q_zero():
+    assert choose_encoding("gzip, deflate, br") == "br"
+    assert choose_encoding("br;q=0, gzip") == "gzip"
+    assert choose_encoding("brotli-ish, gzip;q=0") is None
+    assert choose_encoding("*;q=0") is None
+    assert choose_encoding("identity") is None
@@ -1,52 +1,91 @@
 import asyncio
 import logging
+from datetime import datetime, timedelta
+from typing import Optional
+
 import httpx
-from utils.metadata_parser import fetch_url, parse_meta_tags
+from dependencies import get_http_client
+from utils.metadata_parser import fetch_url, parse_meta_tags, create_http_client
 
 logger = logging.getLogger("climbing_app")
 
+# Album pages fetched concurrently during a metadata refresh
+REFRESH_CONCURRENCY = 5
+# Scheduled refreshes skip albums whose metadata was fetched more recently than this
+REFRESH_MAX_AGE = timedelta(hours=20)
+# Album hash fields compared against a fresh fetch, keyed by parse_meta_tags field
+REFRESHED_FIELDS = {"title": "title", "description": "description", "date": "date", "imageUrl": "image_url"}
+
+
+def _is_stale(album: dict, cutoff: datetime) -> bool:
+    """Whether the album's metadata was last fetched before cutoff (or never)"""
+    try:
+        return datetime.fromisoformat(album.get("metadata_refreshed_at", "")) < cutoff
+    except ValueError:
+        return True
+
 
-async def perform_album_metadata_refresh(redis_store):
+async def perform_album_metadata_refresh(redis_store, max_age: Optional[timedelta] = None):
     """Perform album metadata refresh - can be called manually or automatically"""
     logger.info("🔄 Starting album metadata refresh...")
 
     # Get all albums from Redis
     albums = await redis_store.get_all_albums()
 
+    # Albums fetched recently (including just-submitted ones) already carry fresh metadata
+    if max_age is not None:
+        cutoff = datetime.now() - max_age
+        albums = [album for album in albums if _is_stale(album, cutoff)]
+
     if not albums:
         logger.info("No albums found to refresh")
-        return {"updated": 0, "errors": 0, "message": "No albums found to refresh"}
-
-    updated_count = 0
-    error_count = 0
+        return {"refreshed": 0, "updated": 0, "errors": 0, "message": "No albums found to refresh"}
 
-    # Refresh metadata for each album
-    async with httpx.AsyncClient(timeout=30.0) as client:
-        for album in albums:
-            try:
-                url = album["url"]
+    # Bound in-flight fetches so large libraries don't trip Google Photos rate limits
+    semaphore = asyncio.Semaphore(REFRESH_CONCURRENCY)
 
+    async def refresh_album(client: httpx.AsyncClient, album: dict) -> Optional[bool]:
+        """Refresh one album: True if its metadata changed, False if unchanged, None on failure"""
+        url = album["url"]
+        try:
+            async with semaphore:
                 # Fetch fresh metadata from Google Photos
                 response = await fetch_url(client, url)
-                fresh_metadata = parse_meta_tags(response.text, url)
-
-                # Update Redis with fresh metadata
-                await redis_store.update_album_metadata(url, fresh_metadata)
-                updated_count += 1
-
                 # Small delay to avoid overwhelming Google Photos
                 await asyncio.sleep(0.5)
+            fresh_metadata = parse_meta_tags(response.text, url)
 
-            except Exception as e:
-                error_count += 1
-                logger.warning(f"Failed to refresh metadata for {album.get('url', 'unknown')}: {e}")
-                continue
+            # Only write (and invalidate album caches) when something actually changed
+            changed = any(
+                fresh_metadata.get(field, "") != album.get(stored, "") for field, stored in REFRESHED_FIELDS.items())
+            if changed:
+                await redis_store.update_album_metadata(url, fresh_metadata)
+            await redis_store.mark_album_metadata_refreshed(url)
+            return changed
 
-    logger.info(f"✅ Album metadata refresh completed: {updated_count} updated, {error_count} errors")
+        except Exception as e:
+            logger.warning(f"Failed to refresh metadata for {url}: {e}")
+            return None
+
+    # Reuse the app's pooled client; fall back to a temporary one outside the app (e.g. scripts)
+    client = get_http_client()
+    if client is not None:
+        results = await asyncio.gather(*(refresh_album(client, album) for album in albums))
+    else:
+        async with create_http_client() as client:
+            results = await asyncio.gather(*(refresh_album(client, album) for album in albums))
+
+    updated_count = results.count(True)
+    error_count = results.count(None)
+    refreshed_count = len(results) - error_count
+
+    logger.info(f"✅ Album metadata refresh completed: {refreshed_count} fetched, "
+                f"{updated_count} updated, {error_count} errors")
     return {
+        "refreshed": refreshed_count,
         "updated": updated_count,
         "errors": error_count,
-        "message": f"Refresh completed: {updated_count} updated, {error_count} errors"
+        "message": f"Refresh completed: {refreshed_count} fetched, {updated_count} updated, {error_count} errors"
     }
 
 
@@ -57,7 +96,12 @@ async def refresh_album_metadata(redis_store):
             # Wait 24 hours between refreshes (once per day)
             await asyncio.sleep(60*60*24)
 
-            await perform_album_metadata_refresh(redis_store)
+            # With multiple uvicorn workers, only one of them should refresh per cycle
+            if not await redis_store.acquire_lock("album_metadata_refresh", ttl=60*60):
+                logger.info("Album metadata refresh already claimed by another worker, skipping")
+                continue
+
+            await perform_album_metadata_refresh(redis_store, max_age=REFRESH_MAX_AGE)
 
         except Exception as e:
             logger.error(f"❌ Album metadata refresh task failed: {e}")
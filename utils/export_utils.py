@@ -1,3 +1,4 @@
+import asyncio
 import base64
 import datetime
 import logging
@@ -44,6 +45,12 @@ async def export_redis_database(redis_store) -> str:
     Returns:
         Base64-encoded Redis protocol data for safe JSON transport
     """
+    # The export walks every key with blocking Redis calls; keep it off the event loop
+    return await asyncio.to_thread(_build_redis_export, redis_store)
+
+
+def _build_redis_export(redis_store) -> str:
+    """Build the base64 Redis protocol export synchronously (run in a worker thread)"""
     
     try:
         # Get keys from both text and binary Redis databases
@@ -1,13 +1,30 @@
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 
 from config import settings
 
+# Background thread that writes queued records to the file and console handlers
+_listener: QueueListener | None = None
+
+
+def _stop_listener():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(_stop_listener)
+
 
 def setup_logging():
     """Set up comprehensive logging with both file and console handlers"""
+    global _listener
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
 
@@ -37,12 +54,17 @@ def setup_logging():
     )
     file_handler.setLevel(log_level)
     file_handler.setFormatter(detailed_formatter)
-    root_logger.addHandler(file_handler)
 
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_handler.setFormatter(simple_formatter)
-    root_logger.addHandler(console_handler)
+
+    # Log calls only enqueue; writes and rotation happen off the event loop thread
+    _stop_listener()
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener.start()
 
     app_logger = logging.getLogger("climbing_app")
     app_logger.setLevel(log_level)
@@ -1,47 +1,144 @@
+import asyncio
+import html as html_lib
+import logging
+import random
 import re
 import httpx
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from fastapi import HTTPException
 from pathlib import Path
 
+logger = logging.getLogger("climbing_app")
 
-def inject_css_version(html_path):
-    """Inject CSS version parameter for cache busting"""
+# Precompiled patterns for cache busting and image URL rewriting
+CSS_LINK_PATTERN = re.compile(r'href="/static/css/styles\.css(?:\?[^"}]*)?"')
+JS_SCRIPT_PATTERN = re.compile(r'src="/static/js/([^"\?]+\.js)(?:\?[^\"]*)?"')
+IMAGE_SIZE_PATTERN = re.compile(r"=w\d+.*$")
+
+CSS_PATH = "static/css/styles.css"
+JS_DIR = Path("static/js")
+
+# Versioned, UTF-8 encoded page HTML keyed by path, with the page/CSS/JS mtimes it was built from
+_versioned_html_cache: dict[str, tuple[tuple[float, ...], tuple[str, ...], bytes]] = {}
+
+# Only <meta> and <title> matter for album metadata, so skip building the rest of the tree
+META_TAGS_ONLY = SoupStrainer(["meta", "title"])
+
+# Fast path for the OG tags: scan the raw <meta> tags instead of parsing the document
+OG_META_TAG_PATTERN = re.compile(r'<meta\s[^>]*?property\s*=\s*"(og:[a-z]+)"[^>]*>', re.IGNORECASE)
+CONTENT_ATTR_PATTERN = re.compile(r'\scontent\s*=\s*"([^"]*)"', re.IGNORECASE)
+
+# In-flight upstream fetches keyed by "<kind>:<url>", shared by concurrent callers
+_inflight: dict[str, asyncio.Future] = {}
+
+# Upstream throttling/outage responses worth retrying with backoff
+RETRYABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+MAX_FETCH_ATTEMPTS = 3
+MAX_RETRY_DELAY = 10.0
+# Connection attempts retried by the transport (DNS/connect failures, not responses)
+CONNECT_RETRIES = 2
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
+
+
+def _mtime(path) -> float:
+    """Modification time of path, or 0 if it doesn't exist"""
+    try:
+        return Path(path).stat().st_mtime
+    except FileNotFoundError:
+        return 0.0
+
+
+def inject_css_version(html_path) -> bytes:
+    """Inject CSS version parameter for cache busting (cached encoded until the page or an asset it versions changes)"""
+    cached = _versioned_html_cache.get(html_path)
+    if cached is not None:
+        mtimes, js_files, body = cached
+        if mtimes == (_mtime(html_path), _mtime(CSS_PATH), *(_mtime(JS_DIR / name) for name in js_files)):
+            return body
+
+    html_mtime = _mtime(html_path)
     with open(html_path) as f:
         html = f.read()
-    css_path = "static/css/styles.css"
-    version = int(Path(css_path).stat().st_mtime)
+    css_mtime = Path(CSS_PATH).stat().st_mtime
+    version = int(css_mtime)
     # Replace any existing styles.css reference (with or without query) with versioned one
-    html = re.sub(
-        r'href="/static/css/styles\.css(?:\?[^"}]*)?"',
-        f'href="/static/css/styles.css?v={version}"',
-        html
-    )
+    html = CSS_LINK_PATTERN.sub(f'href="/static/css/styles.css?v={version}"', html)
 
     # Also version all local static JS files individually
+    js_files = []
+    js_mtimes = []
+
     def version_js(match: re.Match) -> str:
         filename = match.group(1)
-        js_path = Path("static/js") / filename
-        try:
-            js_version = int(js_path.stat().st_mtime)
-        except FileNotFoundError:
-            js_version = version  # fall back to css version timestamp
+        js_path = JS_DIR / filename
+        js_mtime = _mtime(js_path)
+        js_files.append(filename)
+        js_mtimes.append(js_mtime)
+        js_version = int(js_mtime) if js_mtime else version  # fall back to css version timestamp
         return f'src="/static/js/{filename}?v={js_version}"'
 
-    html = re.sub(r'src="/static/js/([^"\?]+\.js)(?:\?[^\"]*)?"', version_js, html)
-    return html
+    body = JS_SCRIPT_PATTERN.sub(version_js, html).encode()
+    _versioned_html_cache[html_path] = ((html_mtime, css_mtime, *js_mtimes), tuple(js_files), body)
+    return body
 
 
-async def fetch_url(client: httpx.AsyncClient, url: str):
-    """Generic helper to fetch a URL and handle errors."""
-    try:
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/125.0.0.0 Safari/537.36"
+def create_http_client() -> httpx.AsyncClient:
+    """Create the shared outbound client (HTTP/2 with gzip/br content encoding, pooled connections)"""
+    # The transport retries failed connection attempts; fetch_url handles 429/5xx responses
+    transport = httpx.AsyncHTTPTransport(
+        http2=True,
+        retries=CONNECT_RETRIES,
+        limits=httpx.Limits(max_keepalive_connections=20, max_connections=40, keepalive_expiry=30),
+    )
+    return httpx.AsyncClient(
+        transport=transport,
+        timeout=30.0,
+        headers={
+            "User-Agent": USER_AGENT,
+            "Accept-Encoding": "gzip, br"
         }
-        response = await client.get(
-            url, headers=headers, follow_redirects=True
-        )
+    )
+
+
+async def single_flight(key: str, fetch):
+    """Run fetch() once per key, letting concurrent callers await the same in-flight result"""
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(fetch())
+        _inflight[key] = future
+        future.add_done_callback(lambda _: _inflight.pop(key, None))
+    # Shield so one disconnecting client doesn't cancel the fetch for everyone else
+    return await asyncio.shield(future)
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Seconds to wait before retrying: honour Retry-After, else exponential backoff with jitter"""
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        return min(float(retry_after), MAX_RETRY_DELAY)
+    return min(2 ** attempt + random.uniform(0, 1), MAX_RETRY_DELAY)
+
+
+async def fetch_url(client: httpx.AsyncClient, url: str, stream: bool = False):
+    """Generic helper to fetch a URL and handle errors (stream=True leaves the body unread; caller must aclose)."""
+    try:
+        # The User-Agent comes from the client's default headers (see create_http_client)
+        for attempt in range(MAX_FETCH_ATTEMPTS):
+            request = client.build_request("GET", url)
+            response = await client.send(request, stream=stream, follow_redirects=True)
+            # Back off and retry when upstream is throttling or briefly unavailable
+            if response.status_code not in RETRYABLE_STATUS_CODES or attempt == MAX_FETCH_ATTEMPTS - 1:
+                break
+            await response.aclose()
+            delay = _retry_delay(response, attempt)
+            logger.warning(f"Fetching {url} returned {response.status_code}, retrying in {delay:.1f}s")
+            await asyncio.sleep(delay)
+
+        if response.is_error:
+            await response.aclose()
         response.raise_for_status()
+        logger.debug(f"Fetched {url} over {response.http_version}")
         return response
     except httpx.RequestError as exc:
         raise HTTPException(
@@ -49,27 +146,47 @@ async def fetch_url(client: httpx.AsyncClient, url: str):
         )
 
 
+def _scan_og_tags(html: str) -> dict[str, str]:
+    """Collect og:* meta tag contents with a regex scan (first occurrence of each property wins)"""
+    og_tags: dict[str, str] = {}
+    # OG tags live in <head>, so don't scan the (much larger) body
+    head_end = html.find("</head>")
+    if head_end != -1:
+        html = html[:head_end]
+    for match in OG_META_TAG_PATTERN.finditer(html):
+        prop = match.group(1).lower()
+        content = CONTENT_ATTR_PATTERN.search(match.group(0))
+        if prop not in og_tags and content:
+            og_tags[prop] = html_lib.unescape(content.group(1))
+    return og_tags
+
+
 def parse_meta_tags(html: str, url: str):
     """Parses OG meta tags and modifies the image URL for full size."""
-    soup = BeautifulSoup(html, "html.parser")
-
-    def get_meta_tag(prop):
-        tag = soup.find("meta", property=prop)
-        try:
-            if tag and hasattr(tag, 'attrs'):
-                return tag.attrs.get('content')  # type: ignore
-        except (AttributeError, TypeError):
-            pass
-        return None
-
-    title = (
-        get_meta_tag("og:title")
-        or (soup.title.string if soup.title else "Untitled")
-    )
+    og_tags = _scan_og_tags(html)
+
+    if og_tags.get("og:title"):
+        get_meta_tag = og_tags.get
+        title = og_tags["og:title"]
+    else:
+        # Pages without OG tags fall back to a real parse for <title>
+        # lxml's C parser is much faster than the pure-Python html.parser on Google Photos pages
+        soup = BeautifulSoup(html, "lxml", parse_only=META_TAGS_ONLY)
+
+        def get_meta_tag(prop):
+            tag = soup.find("meta", property=prop)
+            try:
+                if tag and hasattr(tag, 'attrs'):
+                    return tag.attrs.get('content')  # type: ignore
+            except (AttributeError, TypeError):
+                pass
+            return None
+
+        title = soup.title.string if soup.title else "Untitled"
 
-    # Handle title parsing more safely
-    if title and isinstance(title, str) and " · " in title:
-        title, date = title.split(" · ", 1)
+    # Google Photos titles look like "<title> · <date>"; partition leaves date empty without the separator
+    if isinstance(title, str):
+        title, _, date = title.partition(" · ")
     else:
         date = ""
 
@@ -79,7 +196,7 @@ def parse_meta_tags(html: str, url: str):
     image_url = get_meta_tag("og:image") or ""
 
     if image_url and isinstance(image_url, str):
-        image_url = re.sub(r"=w\d+.*$", "=s0", image_url)
+        image_url = IMAGE_SIZE_PATTERN.sub("=s0", image_url)
 
     return {
         "title": title,
@@ -15,6 +15,20 @@ class ValidationError(Exception):
     pass
 
 
+# Image upload limits
+ALLOWED_IMAGE_EXTENSIONS = frozenset({"png", "jpg", "jpeg", "gif", "webp"})
+MAX_IMAGE_SIZE = 5 * 1024 * 1024  # 5MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB
+
+# Precompiled patterns
+GOOGLE_PHOTOS_URL_PATTERN = re.compile(r"https://photos\.app\.goo\.gl/[a-zA-Z0-9]+", re.ASCII)
+NAME_PATTERN = re.compile(r"^[a-zA-Z\s\-']+$")
+REDIS_KEY_PATTERN = re.compile(r"^[a-zA-Z0-9:_-]+$")
+USER_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]+$")
+SKILL_NAME_PATTERN = re.compile(r"^[a-zA-Z\s\-]+$")
+ACHIEVEMENT_NAME_PATTERN = re.compile(r"^[a-zA-Z0-9\s\-]+$")
+
+
 def sanitize_string(value: str, max_length: int = 255) -> str:
     """Sanitize string input by removing HTML and limiting length"""
     if not value:
@@ -38,7 +52,7 @@ def validate_name(name: str) -> str:
     sanitized = sanitize_string(name, max_length=100)
     
     # Check for valid characters (letters, spaces, hyphens, apostrophes)
-    if not re.match(r"^[a-zA-Z\s\-']+$", sanitized):
+    if not NAME_PATTERN.match(sanitized):
         raise ValidationError("Name contains invalid characters")
     
     return sanitized
@@ -55,7 +69,7 @@ def validate_google_photos_url(url: str) -> str:
         raise ValidationError("Invalid URL format")
     
     # Check for Google Photos pattern
-    if not re.match(r"^https://photos\.app\.goo\.gl/[a-zA-Z0-9]+$", url):
+    if not GOOGLE_PHOTOS_URL_PATTERN.fullmatch(url):
         raise ValidationError("Must be a valid Google Photos album URL (e.g., https://photos.app.goo.gl/...)")
     
     return url
@@ -67,12 +81,14 @@ def validate_skill_list(skills: List[str]) -> List[str]:
         return []
     
     validated_skills = []
+    seen = set()
     for skill in skills:
         if not skill or not skill.strip():
             continue
         
         sanitized = sanitize_string(skill, max_length=50)
-        if sanitized not in validated_skills:
+        if sanitized not in seen:
+            seen.add(sanitized)
             validated_skills.append(sanitized)
     
     if len(validated_skills) > 20:
@@ -87,12 +103,14 @@ def validate_location_list(locations: List[str]) -> List[str]:
         return []
     
     validated_locations = []
+    seen = set()
     for location in locations:
         if not location or not location.strip():
             continue
         
         sanitized = sanitize_string(location, max_length=100)
-        if sanitized not in validated_locations:
+        if sanitized not in seen:
+            seen.add(sanitized)
             validated_locations.append(sanitized)
     
     if len(validated_locations) > 10:
@@ -107,12 +125,14 @@ def validate_achievements_list(achievements: List[str]) -> List[str]:
         return []
     
     validated_achievements = []
+    seen = set()
     for achievement in achievements:
         if not achievement or not achievement.strip():
             continue
         
         sanitized = sanitize_string(achievement, max_length=100)
-        if sanitized not in validated_achievements:
+        if sanitized not in seen:
+            seen.add(sanitized)
             validated_achievements.append(sanitized)
     
     if len(validated_achievements) > 20:
@@ -132,9 +152,29 @@ def validate_image_file(content_type: str, file_size: int) -> None:
         raise ValidationError(f"Unsupported image type. Allowed: {', '.join(allowed_types)}")
     
     # Check file size (5MB limit)
-    max_size = 5 * 1024 * 1024  # 5MB
-    if file_size > max_size:
-        raise ValidationError(f"Image too large (max {max_size // (1024*1024)}MB)")
+    if file_size > MAX_IMAGE_SIZE:
+        raise ValidationError(f"Image too large (max {MAX_IMAGE_SIZE // (1024*1024)}MB)")
+
+
+def validate_image_extension(filename: Optional[str]) -> None:
+    """Validate that an uploaded file name has an allowed image extension (if it has one)"""
+    if not filename or "." not in filename:
+        return  # Extensionless blobs are covered by the content type check
+
+    extension = filename.rsplit(".", 1)[-1].lower()
+    if extension not in ALLOWED_IMAGE_EXTENSIONS:
+        raise ValidationError(
+            f"Unsupported image extension. Allowed: {', '.join(sorted(ALLOWED_IMAGE_EXTENSIONS))}")
+
+
+async def read_image_upload(file: UploadFile, max_size: int = MAX_IMAGE_SIZE) -> bytes:
+    """Read an uploaded image in chunks, rejecting it with 413 as soon as it exceeds max_size"""
+    image_data = bytearray()
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        image_data.extend(chunk)
+        if len(image_data) > max_size:
+            raise HTTPException(status_code=413, detail=f"Image too large (max {max_size // (1024*1024)}MB)")
+    return bytes(image_data)
 
 
 def validate_crew_list(crew: List[str]) -> List[str]:
@@ -143,12 +183,14 @@ def validate_crew_list(crew: List[str]) -> List[str]:
         raise ValidationError("At least one crew member is required")
     
     validated_crew = []
+    seen = set()
     for member in crew:
         if not member or not member.strip():
             continue
         
         validated_name = validate_name(member)
-        if validated_name not in validated_crew:
+        if validated_name not in seen:
+            seen.add(validated_name)
             validated_crew.append(validated_name)
     
     if len(validated_crew) > 10:
@@ -163,7 +205,7 @@ def validate_redis_key(key: str) -> str:
         raise ValidationError("Key cannot be empty")
     
     # Only allow alphanumeric, colon, hyphen, underscore
-    if not re.match(r"^[a-zA-Z0-9:_-]+$", key):
+    if not REDIS_KEY_PATTERN.match(key):
         raise ValidationError("Invalid key format")
     
     if len(key) > 250:
@@ -197,7 +239,7 @@ def validate_user_id(user_id: str) -> str:
         raise ValidationError("User ID is required")
     
     # Basic alphanumeric validation
-    if not re.match(r"^[a-zA-Z0-9_-]+$", user_id):
+    if not USER_ID_PATTERN.match(user_id):
         raise ValidationError("Invalid user ID format")
     
     if len(user_id) > 100:
@@ -303,7 +345,7 @@ def validate_skill_name(skill_name: str) -> str:
     sanitized = sanitize_string(skill_name, max_length=50)
     
     # Check for valid characters (letters, spaces, hyphens)
-    if not re.match(r"^[a-zA-Z\s\-]+$", sanitized):
+    if not SKILL_NAME_PATTERN.match(sanitized):
         raise ValidationError("Skill name contains invalid characters")
     
     return sanitized
@@ -317,7 +359,7 @@ def validate_achievement_name(achievement_name: str) -> str:
     sanitized = sanitize_string(achievement_name, max_length=100)
     
     # Check for valid characters (letters, spaces, hyphens, numbers)
-    if not re.match(r"^[a-zA-Z0-9\s\-]+$", sanitized):
+    if not ACHIEVEMENT_NAME_PATTERN.match(sanitized):
         raise ValidationError("Achievement name contains invalid characters")
     
     return sanitized